@@ -17,6 +17,27 @@ from config import SERVER_CONFIG, MODELS, ENDPOINTS, get_full_url
 from logging_utils import endpoint_logger
 
 
+class TokenBucket:
+    """Client-side pacer: allows ``rate`` operations per second with bursts of up to ``capacity``."""
+    __slots__ = ('rate', 'capacity', 'tokens', 'last')
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def take(self, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens and return how long to wait before proceeding (0.0 if none)"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
 class KolosalServerTester:
     def __init__(self, base_url: str = None, api_key: str = None):
         self.base_url = base_url or SERVER_CONFIG["base_url"]
@@ -327,8 +348,15 @@ class KolosalServerTester:
             ("Vector Search", self.test_vector_search)
         ]
         
+        # At most one test start per second; time spent inside a test counts
+        # towards the pause, so only tests faster than that are held back
+        pacer = TokenBucket(rate=1.0)
+        
         results = {}
         for test_name, test_func in tests:
+            wait = pacer.take()
+            if wait:
+                time.sleep(wait)
             self.log(f"Running {test_name} test...")
             try:
                 start_time = time.time()
@@ -351,8 +379,6 @@ class KolosalServerTester:
                     "success": False,
                     "error": str(e)
                 })
-            
-            time.sleep(1)  # Brief pause between tests
         
         # Summary
         self.log("=" * 50)
@@ -7,8 +7,9 @@ and provides backwards compatibility with the existing test infrastructure.
 
 import yaml
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 # Configuration file paths
 CONFIG_DIR = Path(__file__).parent / "config"
@@ -93,6 +94,7 @@ def get_server_config() -> Dict[str, Any]:
         },
         "idle_timeout": server_config.get('idle_timeout', 300),
         "request_timeout": 30,
+        "require_health": server_config.get('require_health', True),
         "cors_enabled": config_manager.config.get('auth', {}).get('cors', {}).get('enabled', True),
         "cors_origins": len(config_manager.config.get('auth', {}).get('cors', {}).get('allowed_origins', ['*'])),
         "public_access": server_config.get('allow_public_access', False),
@@ -101,6 +103,24 @@ def get_server_config() -> Dict[str, Any]:
 
 SERVER_CONFIG = get_server_config()
 
+@dataclass(frozen=True, slots=True)
+class ServerCfg:
+    """Immutable connection settings shared by reference with every tester."""
+    base_url: str
+    api_key: Optional[str] = None
+    timeout: Tuple[float, float] = (3.0, 30.0)  # (connect, read) seconds
+
+    @classmethod
+    def from_config(cls, server_config: Dict[str, Any]) -> "ServerCfg":
+        """Build from a get_server_config() dictionary."""
+        return cls(
+            base_url=server_config["base_url"],
+            api_key=server_config.get("api_key"),
+            timeout=(3.0, float(server_config.get("request_timeout", 30)))
+        )
+
+SERVER = ServerCfg.from_config(SERVER_CONFIG)
+
 # ===== MODEL CONFIGURATION =====
 # Loaded from config/config.yaml models section
 
@@ -332,9 +352,10 @@ def get_search_config() -> Dict[str, Any]:
 
 def reload_configuration():
     """Reload all configuration files."""
-    global config_manager, SERVER_CONFIG, MODELS, FEATURES, AGENT_SYSTEM, LOGGING_CONFIG
+    global config_manager, SERVER_CONFIG, SERVER, MODELS, FEATURES, AGENT_SYSTEM, LOGGING_CONFIG
     config_manager.load_configurations()
     SERVER_CONFIG = get_server_config()
+    SERVER = ServerCfg.from_config(SERVER_CONFIG)
     MODELS = get_models_config()
     FEATURES = get_features_config()
     AGENT_SYSTEM = get_agent_system_config()
@@ -0,0 +1,75 @@
+"""
+JSON helpers for Kolosal Server Test Suite.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers get faster decoding of large server responses
+(model catalogs, engine dumps) without a hard dependency.
+
+orjson raises orjson.JSONDecodeError, a subclass of json.JSONDecodeError,
+so existing ``except json.JSONDecodeError`` / ``except ValueError`` handlers
+keep working with either backend.
+"""
+
+import json
+import weakref
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Encode an object as JSON indented by two spaces, for log output."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode("utf-8")
+else:
+    def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Encode an object as JSON indented by two spaces, for log output."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Decoded JSON bodies by response, so response_json() parses each body once;
+# entries go away with their responses
+_decoded_bodies = weakref.WeakKeyDictionary()
+
+
+def response_json(response: Any) -> Any:
+    """Decode a requests.Response body as JSON, parsing it at most once.
+
+    Testers decode bodies for logging, so tests calling this afterwards reuse
+    that result. Raises ValueError for non-JSON bodies.
+    """
+    try:
+        return _decoded_bodies[response]
+    except KeyError:
+        data = _decoded_bodies[response] = json_loads(response.content)
+        return data
+
+
+def encode_json_kwarg(kwargs: Dict[str, Any]) -> None:
+    """Replace a requests ``json=`` keyword argument with a ``data=`` body from json_dumps.
+
+    The session sending the request must already set Content-Type:
+    application/json. RequestTracker can take ``kwargs['data']`` as its
+    request_body, so the payload is not encoded again for its size field.
+    """
+    if 'json' in kwargs:
+        kwargs['data'] = json_dumps(kwargs.pop('json'))
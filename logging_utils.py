@@ -19,6 +19,8 @@ from typing import Dict, Any, Optional, Union, List
 from pathlib import Path
 import requests
 
+from json_utils import json_loads, json_dumps
+
 
 def extract_id_from_response(response_data: Dict[str, Any], id_field_name: str = "id") -> Optional[str]:
     """
@@ -120,6 +122,7 @@ class EndpointLogger:
         endpoint: str,
         method: str,
         request_data: Optional[Dict[str, Any]] = None,
+        request_body: Optional[bytes] = None,
         response: Optional[requests.Response] = None,
         response_data: Optional[Dict[str, Any]] = None,
         error: Optional[str] = None,
@@ -134,6 +137,7 @@ class EndpointLogger:
             endpoint: The API endpoint being tested
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             request_data: JSON request payload
+            request_body: Encoded request body, if the caller already has it
             response: Response object from requests
             response_data: Parsed response JSON data
             error: Error message if test failed
@@ -154,7 +158,7 @@ class EndpointLogger:
         if request_data is not None:
             log_entry["request"] = {
                 "payload": self._sanitize_data(request_data),
-                "size_bytes": len(json.dumps(request_data).encode('utf-8'))
+                "size_bytes": len(request_body if request_body is not None else json_dumps(request_data))
             }
         
         # Add response details
@@ -346,12 +350,15 @@ class RequestTracker:
         endpoint: str,
         method: str,
         request_data: Optional[Dict[str, Any]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        request_body: Optional[bytes] = None
     ):
         self.test_name = test_name
         self.endpoint = endpoint
         self.method = method
         self.request_data = request_data
+        # The encoded body as sent, so the logged size does not re-encode request_data
+        self.request_body = request_body
         self.metadata = metadata
         self.start_time = None
         self.response = None
@@ -372,7 +379,7 @@ class RequestTracker:
         response_data = None
         if self.response:
             try:
-                response_data = self.response.json()
+                response_data = json_loads(self.response.content)
             except (ValueError, json.JSONDecodeError):
                 response_data = {"raw_content": self.response.text[:500]}
         
@@ -382,6 +389,7 @@ class RequestTracker:
             endpoint=self.endpoint,
             method=self.method,
             request_data=self.request_data,
+            request_body=self.request_body,
             response=self.response,
             response_data=response_data,
             error=self.error,
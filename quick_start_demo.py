@@ -11,10 +11,41 @@ This script demonstrates the complete workflow from the API usage guide:
 Based on the Kolosal Server API Usage Guide.
 """
 
+import asyncio
+import math
+import mmap
+import operator
+import os
+import threading
 import requests
 import json
 import time
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, TypedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from json_utils import json_loads, json_dumps
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # pragma: no cover - optional dependency
+    MultipartEncoder = None
+
+# (connect, read) timeout applied to every demo request
+_REQUEST_TIMEOUT = (3, 30)
+
+# One keep-alive session shared by every helper so consecutive demo calls
+# reuse a pooled connection instead of opening a new one each time.
+# Content-Type is left to requests so multipart uploads keep their boundary.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update({"Connection": "keep-alive"})
 
 def safe_request(func, *args, **kwargs):
     """Safe request wrapper with error handling"""
@@ -28,28 +59,151 @@ def safe_request(func, *args, **kwargs):
         print(f"Request failed: {e}")
         return None
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _post_body(url: str, body: bytes) -> requests.Response:
+    """POST an already-encoded JSON body"""
+    return _SESSION.post(url, data=body, headers=_JSON_HEADERS, timeout=_REQUEST_TIMEOUT)
+
+def _post_json(url: str, payload: Any) -> requests.Response:
+    """POST a JSON body encoded with json_utils (orjson when installed)"""
+    return _post_body(url, json_dumps(payload))
+
+@lru_cache(maxsize=64)
+def _chat_prefix(session_id: str, use_rag: Optional[bool]) -> bytes:
+    """Encoded chat payload up to the message value, e.g. b'{"session_id":"s","message":'
+
+    The session fields are the same for every message in a session, so they
+    are encoded once and only the message is serialized per call.
+    """
+    fields = {"session_id": session_id}
+    if use_rag is not None:
+        fields["use_rag"] = use_rag
+    return json_dumps(fields)[:-1] + b',"message":'
+
+def _chat_body(message: str, session_id: str, use_rag: Optional[bool] = None) -> bytes:
+    """Encode a /chat payload from the cached session prefix"""
+    return _chat_prefix(session_id, use_rag) + json_dumps(message) + b"}"
+
+def _parse(response: requests.Response) -> Any:
+    """Decode a JSON response body with json_utils.
+
+    Decode errors are re-raised as requests' JSONDecodeError, as
+    response.json() would, so safe_request still catches them.
+    """
+    try:
+        return json_loads(response.content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+def _run_parallel(*calls):
+    """Run (func, *args) tuples on worker threads and return their results in order."""
+    async def runner():
+        return await asyncio.gather(*(asyncio.to_thread(func, *args) for func, *args in calls))
+    return asyncio.run(runner())
+
+# ===== QUERY SIMILARITY CACHE =====
+# search_documents remembers its responses, keyed by the query embedding. A
+# new query whose cosine similarity to a cached one reaches
+# _SIMILARITY_THRESHOLD reuses that response instead of calling the server.
+# Entries are namespaced by call kind, server and parameters, evicted LRU,
+# and dropped whenever documents are added. Chat is not cached: the server
+# keeps per-session state, so a repeated message can get a different answer.
+
+_QUERY_CACHE_SIZE = 128
+_SIMILARITY_THRESHOLD = 0.95
+_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# (namespace, normalized query) -> (unit embedding or None, response)
+_QUERY_CACHE: "OrderedDict[Tuple, Tuple[Optional[List[float]], Any]]" = OrderedDict()
+_QUERY_CACHE_LOCK = threading.Lock()
+# Servers without an embedding endpoint (404/501); only exact matches are used for them
+_NO_EMBEDDINGS = set()
+
+def _embed_query(base_url: str, text: str) -> Optional[List[float]]:
+    """Embed a query with the server's embedding model, normalized to unit length.
+
+    Returns None when the query could not be embedded; only a 404/501 turns
+    embeddings off for the server, other failures affect just this query.
+    """
+    if base_url in _NO_EMBEDDINGS:
+        return None
+    try:
+        response = _post_json(f"{base_url}/v1/embeddings", {"model": _EMBEDDING_MODEL, "input": text})
+        if response.status_code in (404, 501):
+            _NO_EMBEDDINGS.add(base_url)
+            return None
+        response.raise_for_status()
+        vector = _parse(response)["data"][0]["embedding"]
+    except (requests.exceptions.RequestException, ValueError, KeyError, IndexError, TypeError):
+        return None
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else None
+
+# Dot product of two equal-length vectors; math.sumprod (3.12+) runs the loop in C
+_dot = getattr(math, "sumprod", None) or (lambda a, b: sum(map(operator.mul, a, b)))
+
+def _best_match(namespace: Tuple, vector: List[float]) -> Optional[Tuple]:
+    """Return the cache key in namespace most similar to vector, if above the threshold"""
+    best_key, best_score = None, _SIMILARITY_THRESHOLD
+    for cached_key, (cached_vector, _) in _QUERY_CACHE.items():
+        if cached_key[0] != namespace or cached_vector is None:
+            continue
+        score = _dot(vector, cached_vector)
+        if score >= best_score:
+            best_key, best_score = cached_key, score
+    return best_key
+
+def _cached_query(namespace: Tuple, base_url: str, query: str, fetch):
+    """Return a cached response for query (or a near-duplicate), else fetch() and cache it"""
+    key = (namespace, " ".join(query.lower().split()))
+    with _QUERY_CACHE_LOCK:
+        if key in _QUERY_CACHE:
+            _QUERY_CACHE.move_to_end(key)
+            return _QUERY_CACHE[key][1]
+        comparable = any(cached_key[0] == namespace and cached_vector is not None
+                         for cached_key, (cached_vector, _) in _QUERY_CACHE.items())
+
+    if comparable:
+        vector = _embed_query(base_url, query)
+        if vector is not None:
+            with _QUERY_CACHE_LOCK:
+                best_key = _best_match(namespace, vector)
+                if best_key is not None:
+                    _QUERY_CACHE.move_to_end(best_key)
+                    return _QUERY_CACHE[best_key][1]
+        result = fetch()
+    else:
+        # Nothing to compare against yet: embed alongside the fetch, so this
+        # miss does not wait for an extra round trip
+        vector, result = _run_parallel((_embed_query, base_url, query), (fetch,))
+    if isinstance(result, dict) and 'error' not in result:
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE[key] = (vector, result)
+            _QUERY_CACHE.move_to_end(key)
+            while len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+                _QUERY_CACHE.popitem(last=False)
+    return result
+
+def _invalidate_query_cache(base_url: str):
+    """Drop cached answers for a server whose documents just changed"""
+    with _QUERY_CACHE_LOCK:
+        for key in [k for k in _QUERY_CACHE if k[0][1] == base_url]:
+            del _QUERY_CACHE[key]
+
 def chat_with_agent(base_url: str, message: str, session_id: str = "test-session"):
     """Basic chat with agent"""
     url = f"{base_url}/chat"
-    payload = {
-        "message": message,
-        "session_id": session_id
-    }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_body(url, _chat_body(message, session_id))
+    return _parse(response)
 
 def rag_chat(base_url: str, message: str, session_id: str = "rag-session", use_context: bool = True):
     """RAG-powered chat (chat with document context)"""
     url = f"{base_url}/chat"
-    payload = {
-        "message": message,
-        "session_id": session_id,
-        "use_rag": use_context
-    }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_body(url, _chat_body(message, session_id, use_context))
+    return _parse(response)
 
 def add_text_content(base_url: str, content: str, title: str, metadata: dict = None):
     """Add text content directly"""
@@ -60,19 +214,34 @@ def add_text_content(base_url: str, content: str, title: str, metadata: dict = N
         "metadata": metadata or {}
     }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_json(url, payload)
+    _invalidate_query_cache(base_url)
+    return _parse(response)
 
 def upload_document(base_url: str, file_path: str, document_type: str = "text"):
-    """Upload documents to knowledge base"""
+    """Upload documents to knowledge base
+
+    With requests-toolbelt installed the multipart body is streamed from a
+    memory-mapped file instead of being built in memory first.
+    """
     url = f"{base_url}/documents/upload"
     
     with open(file_path, 'rb') as file:
-        files = {'file': file}
-        data = {'type': document_type}
-        
-        response = requests.post(url, files=files, data=data)
-    return response.json()
+        if MultipartEncoder is not None and os.fstat(file.fileno()).st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                encoder = MultipartEncoder(fields={
+                    'type': document_type,
+                    'file': (os.path.basename(file_path), mapped, 'application/octet-stream')
+                })
+                response = _SESSION.post(url, data=encoder, headers={'Content-Type': encoder.content_type},
+                                         timeout=_REQUEST_TIMEOUT)
+        else:
+            files = {'file': file}
+            data = {'type': document_type}
+            
+            response = _SESSION.post(url, files=files, data=data, timeout=_REQUEST_TIMEOUT)
+    _invalidate_query_cache(base_url)
+    return _parse(response)
 
 def search_documents(base_url: str, query: str, limit: int = 5):
     """Search documents using semantic search"""
@@ -82,8 +251,10 @@ def search_documents(base_url: str, query: str, limit: int = 5):
         "limit": limit
     }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    def fetch():
+        response = _post_json(url, payload)
+        return _parse(response)
+    return _cached_query(("search", base_url, limit), base_url, query, fetch)
 
 def advanced_search(base_url: str, query: str, filters: dict = None, sort_by: str = "relevance"):
     """Advanced document search with filters"""
@@ -94,8 +265,8 @@ def advanced_search(base_url: str, query: str, filters: dict = None, sort_by: st
         "sort_by": sort_by
     }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_json(url, payload)
+    return _parse(response)
 
 def create_workflow(base_url: str, name: str, description: str, steps: list):
     """Create a new workflow"""
@@ -106,35 +277,80 @@ def create_workflow(base_url: str, name: str, description: str, steps: list):
         "steps": steps
     }
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_json(url, payload)
+    return _parse(response)
 
 def execute_workflow(base_url: str, workflow_id: str, inputs: dict = None):
     """Execute a workflow"""
     url = f"{base_url}/workflows/{workflow_id}/execute"
     payload = {"inputs": inputs or {}}
     
-    response = requests.post(url, json=payload)
-    return response.json()
+    response = _post_json(url, payload)
+    return _parse(response)
+
+# Execution states that mean the workflow is still in progress
+_WORKFLOW_ACTIVE_STATES = {"pending", "queued", "running", "in_progress"}
+
+def wait_for_workflow(base_url: str, workflow_id: str, execution: dict, deadline: float = 10.0):
+    """Poll the workflow status with exponential backoff until it leaves an active state.
+
+    Returns the last status payload (or the execution response if no polling
+    was needed). Stops early if the server has no status endpoint (404) and
+    gives up once deadline seconds have passed.
+    """
+    status = execution
+    if not isinstance(status, dict) or str(status.get('status', '')).lower() not in _WORKFLOW_ACTIVE_STATES:
+        return status
+
+    url = f"{base_url}/workflows/{workflow_id}/status"
+    delay = 0.05
+    give_up_at = time.monotonic() + deadline
+    while time.monotonic() < give_up_at:
+        response = _SESSION.get(url, timeout=_REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            break
+        status = _parse(response)
+        if not isinstance(status, dict) or str(status.get('status', '')).lower() not in _WORKFLOW_ACTIVE_STATES:
+            break
+        time.sleep(min(delay, max(0.0, give_up_at - time.monotonic())))
+        delay = min(delay * 2, 1.6)
+    return status
 
 def get_chat_history(base_url: str, session_id: str):
     """Get chat history"""
     url = f"{base_url}/sessions/{session_id}/history"
-    response = requests.get(url)
-    return response.json()
+    response = _SESSION.get(url, timeout=_REQUEST_TIMEOUT)
+    return _parse(response)
 
 def clear_session(base_url: str, session_id: str):
     """Clear session"""
     url = f"{base_url}/sessions/{session_id}/clear"
-    response = requests.delete(url)
-    return response.json()
+    response = _SESSION.delete(url, timeout=_REQUEST_TIMEOUT)
+    return _parse(response)
+
+class WorkflowResults(TypedDict):
+    """Responses collected by complete_rag_workflow (None when a step failed or was skipped)"""
+    document: Optional[dict]
+    search: Optional[dict]
+    chat: Optional[dict]
+    workflow: Optional[dict]
+    execution: Optional[dict]
+    execution_status: Optional[dict]
 
-def complete_rag_workflow(base_url: str):
+def complete_rag_workflow(base_url: str) -> WorkflowResults:
     """Complete example workflow from the API guide"""
     print("🚀 Starting Complete RAG Workflow Demo")
     print("=" * 50)
     
-    results = {}
+    # All keys up front, so every run returns the same shape
+    results: WorkflowResults = {
+        'document': None,
+        'search': None,
+        'chat': None,
+        'workflow': None,
+        'execution': None,
+        'execution_status': None
+    }
     
     # 1. Upload knowledge
     print("📚 Step 1: Adding knowledge content...")
@@ -149,11 +365,14 @@ def complete_rag_workflow(base_url: str):
         results['document'] = doc
     else:
         print("❌ Failed to add document")
-        results['document'] = None
     
-    # 2. Search for relevant info
+    # 2 + 3. Search and RAG chat don't depend on each other, so run them together
     print("\n🔍 Step 2: Searching for pricing information...")
-    search_results = safe_request(search_documents, base_url, "software pricing")
+    print("💬 Step 3: Testing RAG-enabled chat...")
+    search_results, response = _run_parallel(
+        (safe_request, search_documents, base_url, "software pricing"),
+        (safe_request, rag_chat, base_url, "How much does the premium package cost?")
+    )
     
     if search_results:
         results_count = len(search_results.get('results', []))
@@ -161,11 +380,6 @@ def complete_rag_workflow(base_url: str):
         results['search'] = search_results
     else:
         print("❌ Search failed")
-        results['search'] = None
-    
-    # 3. Chat with RAG context
-    print("\n💬 Step 3: Testing RAG-enabled chat...")
-    response = safe_request(rag_chat, base_url, "How much does the premium package cost?")
     
     if response:
         chat_response = response.get('response', '')
@@ -175,7 +389,6 @@ def complete_rag_workflow(base_url: str):
         results['chat'] = response
     else:
         print("❌ RAG chat failed")
-        results['chat'] = None
     
     # 4. Create workflow for customer inquiry
     print("\n⚙️ Step 4: Creating customer inquiry workflow...")
@@ -206,61 +419,82 @@ def complete_rag_workflow(base_url: str):
             execution_id = execution_result.get('execution_id') or execution_result.get('id')
             print(f"✅ Workflow executed: {execution_id}")
             results['execution'] = execution_result
+            
+            final_status = safe_request(wait_for_workflow, base_url, workflow_id, execution_result)
+            if final_status:
+                print(f"📋 Workflow status: {final_status.get('status', 'unknown')}")
+                results['execution_status'] = final_status
         else:
             print("❌ Workflow execution failed")
-            results['execution'] = None
     else:
         print("❌ Workflow creation failed")
-        results['workflow'] = None
     
     return results
 
+def _check_knowledge_added(response: requests.Response) -> List[str]:
+    """Report lines for the knowledge-add step"""
+    if response.status_code == 200:
+        return ["✅ Knowledge added successfully"]
+    return [f"❌ Failed to add knowledge: {response.status_code}"]
+
+def _check_search(response: requests.Response) -> List[str]:
+    """Report lines for the search step"""
+    if response.status_code != 200:
+        return [f"❌ Search failed: {response.status_code}"]
+    search_data = _parse(response)
+    results_count = len(search_data.get('results', []))
+    return [f"✅ Search successful: Found {results_count} results"]
+
+def _check_rag_chat(response: requests.Response) -> List[str]:
+    """Report lines for the RAG chat step"""
+    if response.status_code != 200:
+        return [f"❌ RAG chat failed: {response.status_code}"]
+    chat_data = _parse(response)
+    response_text = chat_data.get('response', '')
+    return ["✅ RAG chat successful", f"Response preview: {response_text[:100]}..."]
+
 def quick_start_demo(base_url: str = "http://127.0.0.1:8080"):
-    """Complete example combining all features"""
+    """Complete example combining all features
+
+    Steps 1-3 don't need each other's results, so each response is decoded
+    and checked on a worker thread while the next request is in flight.
+    """
     print("🎯 Quick Start Demo - Testing All Features")
     print("=" * 50)
     
     # 1. Add some knowledge
-    print("📚 Adding knowledge to the system...")
     knowledge = {
         "content": "Our AI service offers three tiers: Basic ($50/month), Pro ($150/month), and Enterprise ($500/month).",
         "title": "Service Pricing",
         "metadata": {"category": "pricing"}
     }
-    doc_response = requests.post(f"{base_url}/documents", json=knowledge)
-    if doc_response.status_code == 200:
-        print("✅ Knowledge added successfully")
-    else:
-        print(f"❌ Failed to add knowledge: {doc_response.status_code}")
-    
     # 2. Search the knowledge
-    print("\n🔍 Searching the knowledge base...")
     search_payload = {"query": "pricing tiers", "limit": 3}
-    search_result = requests.post(f"{base_url}/search", json=search_payload)
-    
-    if search_result.status_code == 200:
-        search_data = search_result.json()
-        results_count = len(search_data.get('results', []))
-        print(f"✅ Search successful: Found {results_count} results")
-    else:
-        print(f"❌ Search failed: {search_result.status_code}")
-    
     # 3. Chat with RAG
-    print("\n💬 Testing RAG-enabled chat...")
     chat_payload = {
         "message": "What are your pricing options?",
         "session_id": "demo-session",
         "use_rag": True
     }
-    chat_result = requests.post(f"{base_url}/chat", json=chat_payload)
-    
-    if chat_result.status_code == 200:
-        chat_data = chat_result.json()
-        response_text = chat_data.get('response', '')
-        print(f"✅ RAG chat successful")
-        print(f"Response preview: {response_text[:100]}...")
-    else:
-        print(f"❌ RAG chat failed: {chat_result.status_code}")
+    steps = [
+        ("📚 Adding knowledge to the system...", f"{base_url}/documents", knowledge, _check_knowledge_added),
+        ("\n🔍 Searching the knowledge base...", f"{base_url}/search", search_payload, _check_search),
+        ("\n💬 Testing RAG-enabled chat...", f"{base_url}/chat", chat_payload, _check_rag_chat),
+    ]
+    
+    with ThreadPoolExecutor(max_workers=1) as validator:
+        checks = []
+        for header, url, payload, check in steps:
+            response = _post_json(url, payload)
+            checks.append((header, validator.submit(check, response)))
+        
+        for header, check in checks:
+            print(header)
+            try:
+                for line in check.result():
+                    print(line)
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Invalid response: {e}")
     
     # 4. Create and execute workflow
     print("\n⚙️ Testing workflow functionality...")
@@ -272,19 +506,22 @@ def quick_start_demo(base_url: str = "http://127.0.0.1:8080"):
             {"name": "format_response", "type": "generation"}
         ]
     }
-    workflow_result = requests.post(f"{base_url}/workflows", json=workflow_payload)
+    workflow_result = _post_json(f"{base_url}/workflows", workflow_payload)
     
     if workflow_result.status_code == 200:
-        workflow_data = workflow_result.json()
+        workflow_data = _parse(workflow_result)
         workflow_id = workflow_data.get('id') or workflow_data.get('workflow_id')
         print(f"✅ Workflow created: {workflow_id}")
         
         # Execute the workflow
         execution_payload = {"inputs": {"query": "enterprise pricing"}}
-        execution_result = requests.post(f"{base_url}/workflows/{workflow_id}/execute", json=execution_payload)
+        execution_result = _post_json(f"{base_url}/workflows/{workflow_id}/execute", execution_payload)
         
         if execution_result.status_code == 200:
             print("✅ Workflow executed successfully")
+            final_status = safe_request(lambda: wait_for_workflow(base_url, workflow_id, _parse(execution_result)))
+            if final_status:
+                print(f"📋 Workflow status: {final_status.get('status', 'unknown')}")
         else:
             print(f"❌ Workflow execution failed: {execution_result.status_code}")
     else:
@@ -292,34 +529,20 @@ def quick_start_demo(base_url: str = "http://127.0.0.1:8080"):
     
     print("\n🏁 Quick start demo completed!")
 
-def test_basic_functionality(base_url: str = "http://127.0.0.1:8080"):
-    """Test basic functionality step by step"""
-    print("🧪 Testing Basic Kolosal Server Functionality")
-    print("=" * 50)
-    
-    test_results = {
-        'basic_chat': False,
-        'document_add': False,
-        'document_search': False,
-        'rag_chat': False,
-        'workflow_create': False,
-        'workflow_execute': False
-    }
-    
-    # Test 1: Basic Chat
-    print("\n1️⃣ Testing basic chat...")
+def _probe_basic_chat(base_url: str) -> bool:
+    """Test 1: basic chat"""
     try:
         result = chat_with_agent(base_url, "Hello! Can you help me?")
         if result and result.get('response'):
             print("✅ Basic chat: PASS")
-            test_results['basic_chat'] = True
-        else:
-            print("❌ Basic chat: FAIL - No response")
+            return True
+        print("❌ Basic chat: FAIL - No response")
     except Exception as e:
         print(f"❌ Basic chat: FAIL - {e}")
-    
-    # Test 2: Document Addition
-    print("\n2️⃣ Testing document addition...")
+    return False
+
+def _probe_document_add(base_url: str) -> bool:
+    """Test 2: document addition"""
     try:
         result = add_text_content(
             base_url,
@@ -329,38 +552,38 @@ def test_basic_functionality(base_url: str = "http://127.0.0.1:8080"):
         )
         if result and (result.get('id') or result.get('document_id')):
             print("✅ Document addition: PASS")
-            test_results['document_add'] = True
-        else:
-            print("❌ Document addition: FAIL - No document ID")
+            return True
+        print("❌ Document addition: FAIL - No document ID")
     except Exception as e:
         print(f"❌ Document addition: FAIL - {e}")
-    
-    # Test 3: Document Search
-    print("\n3️⃣ Testing document search...")
+    return False
+
+def _probe_document_search(base_url: str) -> bool:
+    """Test 3: document search"""
     try:
         result = search_documents(base_url, "AI machine learning")
         if result and isinstance(result.get('results'), list):
             print(f"✅ Document search: PASS - Found {len(result['results'])} results")
-            test_results['document_search'] = True
-        else:
-            print("❌ Document search: FAIL - No results")
+            return True
+        print("❌ Document search: FAIL - No results")
     except Exception as e:
         print(f"❌ Document search: FAIL - {e}")
-    
-    # Test 4: RAG Chat
-    print("\n4️⃣ Testing RAG-enabled chat...")
+    return False
+
+def _probe_rag_chat(base_url: str) -> bool:
+    """Test 4: RAG-enabled chat"""
     try:
         result = rag_chat(base_url, "What do you know about AI?")
         if result and result.get('response'):
             print("✅ RAG chat: PASS")
-            test_results['rag_chat'] = True
-        else:
-            print("❌ RAG chat: FAIL - No response")
+            return True
+        print("❌ RAG chat: FAIL - No response")
     except Exception as e:
         print(f"❌ RAG chat: FAIL - {e}")
-    
-    # Test 5: Workflow Creation
-    print("\n5️⃣ Testing workflow creation...")
+    return False
+
+def _probe_workflow_create(base_url: str) -> Optional[str]:
+    """Test 5: workflow creation, returns the new workflow ID"""
     try:
         result = create_workflow(
             base_url,
@@ -368,27 +591,69 @@ def test_basic_functionality(base_url: str = "http://127.0.0.1:8080"):
             description="Simple test workflow",
             steps=[{"name": "analyze", "type": "analysis"}]
         )
-        workflow_id = None
         if result and (result.get('id') or result.get('workflow_id')):
-            workflow_id = result.get('id') or result.get('workflow_id')
             print("✅ Workflow creation: PASS")
-            test_results['workflow_create'] = True
-            
-            # Test 6: Workflow Execution
-            print("\n6️⃣ Testing workflow execution...")
-            try:
-                exec_result = execute_workflow(workflow_id, {"test": "data"})
-                if exec_result and (exec_result.get('execution_id') or exec_result.get('id')):
-                    print("✅ Workflow execution: PASS")
-                    test_results['workflow_execute'] = True
-                else:
-                    print("❌ Workflow execution: FAIL - No execution ID")
-            except Exception as e:
-                print(f"❌ Workflow execution: FAIL - {e}")
-        else:
-            print("❌ Workflow creation: FAIL - No workflow ID")
+            return result.get('id') or result.get('workflow_id')
+        print("❌ Workflow creation: FAIL - No workflow ID")
     except Exception as e:
         print(f"❌ Workflow creation: FAIL - {e}")
+    return None
+
+def _probe_workflow_execute(base_url: str, workflow_id: str) -> bool:
+    """Test 6: workflow execution"""
+    try:
+        exec_result = execute_workflow(base_url, workflow_id, {"test": "data"})
+        if exec_result and (exec_result.get('execution_id') or exec_result.get('id')):
+            print("✅ Workflow execution: PASS")
+            return True
+        print("❌ Workflow execution: FAIL - No execution ID")
+    except Exception as e:
+        print(f"❌ Workflow execution: FAIL - {e}")
+    return False
+
+async def _run_basic_functionality(base_url: str, test_results: Dict[str, bool]):
+    """Run the probes as a dependency graph, overlapping independent requests.
+
+    chat and document add start together; search, RAG chat and workflow
+    creation wait only for the document; execution waits for the workflow.
+    """
+    print("\n1️⃣ 2️⃣ Testing basic chat and document addition...")
+    chat_task = asyncio.create_task(asyncio.to_thread(_probe_basic_chat, base_url))
+    test_results['document_add'] = await asyncio.to_thread(_probe_document_add, base_url)
+
+    print("\n3️⃣ 4️⃣ 5️⃣ Testing document search, RAG-enabled chat and workflow creation...")
+    search_ok, rag_ok, workflow_id = await asyncio.gather(
+        asyncio.to_thread(_probe_document_search, base_url),
+        asyncio.to_thread(_probe_rag_chat, base_url),
+        asyncio.to_thread(_probe_workflow_create, base_url)
+    )
+    test_results['document_search'] = search_ok
+    test_results['rag_chat'] = rag_ok
+    test_results['workflow_create'] = workflow_id is not None
+
+    if workflow_id:
+        print("\n6️⃣ Testing workflow execution...")
+        test_results['workflow_execute'] = await asyncio.to_thread(
+            _probe_workflow_execute, base_url, workflow_id
+        )
+
+    test_results['basic_chat'] = await chat_task
+
+def test_basic_functionality(base_url: str = "http://127.0.0.1:8080"):
+    """Test basic functionality, running independent steps concurrently"""
+    print("🧪 Testing Basic Kolosal Server Functionality")
+    print("=" * 50)
+    
+    test_results = {
+        'basic_chat': False,
+        'document_add': False,
+        'document_search': False,
+        'rag_chat': False,
+        'workflow_create': False,
+        'workflow_execute': False
+    }
+    
+    asyncio.run(_run_basic_functionality(base_url, test_results))
     
     # Summary
     passed = sum(test_results.values())
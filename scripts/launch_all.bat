@@ -52,7 +52,7 @@ timeout /t 10 /nobreak >nul
 REM Run test script with virtual environment
 echo Starting test suite...
 start "Kolosal Test" powershell -NoExit -Command ^
-"cd '!TEST_SERVER_PATH!'; if (Test-Path '!VENV_ACTIVATE_PATH!') { .\!VENV_ACTIVATE_PATH! }; python launcher.py --run-tests"
+"cd '!TEST_SERVER_PATH!'; if (Test-Path '!VENV_ACTIVATE_PATH!') { .\!VENV_ACTIVATE_PATH! }; python -m compileall -q -j 0 .; python -m scripts.launcher --run-tests"
 
 echo.
 echo All services started! Check the opened terminal windows.
@@ -5,6 +5,7 @@
 param(
     [switch]$TestEndpoints,
     [switch]$RunTests,
+    [switch]$SkipChecks,
     [switch]$Help
 )
 
@@ -15,6 +16,7 @@ if ($Help) {
     Write-Host "Options:"
     Write-Host "  -TestEndpoints    Test endpoint availability only"
     Write-Host "  -RunTests        Run the full test suite"
+    Write-Host "  -SkipChecks      Skip the prerequisite check before running tests"
     Write-Host "  -Help            Show this help message"
     Write-Host ""
     Write-Host "Examples:"
@@ -40,7 +42,7 @@ try {
 }
 
 # Check if required files exist
-$requiredFiles = @("main.py", "config.py", "launcher.py", "endpoint_tester.py")
+$requiredFiles = @("main.py", "config.py", "scripts/launcher.py", "utils/endpoint_tester.py")
 foreach ($file in $requiredFiles) {
     if (Test-Path $file) {
         Write-Host "✅ Found: $file"
@@ -51,7 +53,7 @@ foreach ($file in $requiredFiles) {
 }
 
 # Build Python command arguments
-$pythonArgs = @("launcher.py")
+$pythonArgs = @("-m", "scripts.launcher")
 
 if ($TestEndpoints) {
     $pythonArgs += "--test-endpoints"
@@ -63,6 +65,10 @@ if ($RunTests) {
     $pythonArgs += "--run-tests"
 }
 
+if ($SkipChecks) {
+    $pythonArgs += "--skip-checks"
+}
+
 # If no specific action, show help
 if (-not $TestEndpoints -and -not $RunTests) {
     Write-Host ""
@@ -73,6 +79,9 @@ if (-not $TestEndpoints -and -not $RunTests) {
     exit 0
 }
 
+# Precompile bytecode so repeat runs load modules from __pycache__ instead of re-parsing sources
+& python -m compileall -q -j 0 . | Out-Null
+
 Write-Host ""
 Write-Host "🚀 Executing: python $($pythonArgs -join ' ')"
 Write-Host ""
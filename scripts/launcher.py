@@ -3,76 +3,181 @@
 Quick launcher for Kolosal Server tests with endpoint validation.
 
 This script provides a convenient way to run tests with proper configuration validation.
+Run it from the repository root as a module:
+
+    python -m scripts.launcher --run-tests
 """
 
+import json
+import os
 import sys
-import argparse
-sys.path.append('..')
-from utils.endpoint_tester import print_endpoint_report, validate_server_configuration
-from config import SERVER_CONFIG, MODELS
-
-def check_prerequisites():
-    """Check if all prerequisites are met."""
-    print("🔍 Checking prerequisites...")
-    
-    # Validate server configuration
+import time
+
+USAGE = """usage: python -m scripts.launcher [-h] [--test-endpoints] [--run-tests] [--skip-checks]
+
+Kolosal Server Test Launcher
+
+options:
+  -h, --help        show this help message and exit
+  --test-endpoints  Test endpoint availability only
+  --run-tests       Run the full test suite
+  --skip-checks     Skip the prerequisite check (alias: --no-validation)
+"""
+
+KNOWN_FLAGS = {"--test-endpoints", "--run-tests", "--skip-checks", "--no-validation"}
+
+MSG_SERVER_DOWN = "❌ Kolosal Server is not responding"
+MSG_SERVER_DOWN_HINT = "   Please ensure the server is running and accessible"
+MSG_SERVER_OK = "✅ Server is responding"
+MSG_HEALTH_MISSING = "⚠️  Health endpoint not available - this may be normal"
+MSG_HEALTH_OK = "✅ Health endpoint available"
+MSG_NO_MODELS = "⚠️  No models detected - may need to be loaded on demand"
+
+# Successful validation results are reused for a short while so back-to-back
+# launcher runs do not re-probe the same server
+VALIDATION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "kolosal", "validation.json")
+VALIDATION_CACHE_TTL = 30.0
+
+
+def load_cached_validation(base_url):
+    """Return the cached validation for base_url if it is still fresh, else None."""
+    try:
+        with open(VALIDATION_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("base_url") != base_url:
+        return None
+    if time.time() - cached.get("ts", 0) >= VALIDATION_CACHE_TTL:
+        return None
+    return cached.get("result")
+
+
+def store_validation(base_url, result):
+    """Write the validation result for base_url to the cache file."""
+    try:
+        os.makedirs(os.path.dirname(VALIDATION_CACHE_PATH), exist_ok=True)
+        tmp_path = VALIDATION_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"base_url": base_url, "ts": time.time(), "result": result}, f)
+        os.replace(tmp_path, VALIDATION_CACHE_PATH)
+    except OSError:
+        # The cache is only an optimisation
+        pass
+
+
+def write_lines(lines):
+    """Write a block of lines to stdout with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def get_validation(base_url):
+    """Validate the server configuration, reusing a recent result for the same server.
+
+    Returns (validation, from_cache).
+    """
+    from utils.endpoint_tester import validate_server_configuration
+
+    validation = load_cached_validation(base_url)
+    if validation is not None:
+        return validation, True
     validation = validate_server_configuration()
+    if validation["server_responding"]:
+        store_validation(base_url, validation)
+    return validation, False
+
+def check_prerequisites(validation=None, from_cache=False):
+    """Check if all prerequisites are met.
+
+    ``validation`` is a result from get_validation(); it is fetched here when
+    not supplied.
+    """
+    from config import SERVER_CONFIG, MODELS
+
+    # The header goes out on its own; the report is written in one block below
+    write_lines(["🔍 Checking prerequisites..."])
+    report = []
+    
+    if validation is None:
+        validation, from_cache = get_validation(SERVER_CONFIG['base_url'])
+    if from_cache:
+        report.append(f"   (using validation result cached in the last {VALIDATION_CACHE_TTL:.0f}s)")
     
     if not validation["server_responding"]:
-        print("❌ Kolosal Server is not responding")
-        print(f"   Expected server at: {SERVER_CONFIG['base_url']}")
-        print("   Please ensure the server is running and accessible")
+        report.append(MSG_SERVER_DOWN)
+        report.append(f"   Expected server at: {SERVER_CONFIG['base_url']}")
+        report.append(MSG_SERVER_DOWN_HINT)
+        write_lines(report)
         return False
     
-    print("✅ Server is responding")
+    report.append(MSG_SERVER_OK)
     
     if not validation["health_endpoint"]:
-        print("⚠️  Health endpoint not available - this may be normal")
+        report.append(MSG_HEALTH_MISSING)
     else:
-        print("✅ Health endpoint available")
+        report.append(MSG_HEALTH_OK)
     
     if validation["available_models"]:
-        print(f"✅ Found {len(validation['available_models'])} model(s)")
-        expected_models = [MODELS["primary_llm"], MODELS["alt_llm"], MODELS["embedding_small"]]
-        for model in expected_models:
-            if model in validation["available_models"]:
-                print(f"   ✅ {model}")
-            else:
-                print(f"   ⚠️  {model} (may not be loaded)")
+        available = set(validation["available_models"])
+        report.append(f"✅ Found {len(validation['available_models'])} model(s)")
+        expected_models = {MODELS["primary_llm"], MODELS["alt_llm"], MODELS["embedding_small"]}
+        report.extend(f"   ✅ {model}" for model in sorted(expected_models & available))
+        report.extend(f"   ⚠️  {model} (may not be loaded)" for model in sorted(expected_models - available))
     else:
-        print("⚠️  No models detected - may need to be loaded on demand")
+        report.append(MSG_NO_MODELS)
     
+    write_lines(report)
     return True
 
 def main():
-    parser = argparse.ArgumentParser(description='Kolosal Server Test Launcher')
-    parser.add_argument('--test-endpoints', action='store_true',
-                       help='Test endpoint availability only')
-    parser.add_argument('--run-tests', action='store_true',
-                       help='Run the full test suite')
-    
-    args = parser.parse_args()
-    
-    print("="*60)
-    print("KOLOSAL SERVER TEST LAUNCHER")
-    print("="*60)
-    print(f"Server URL: {SERVER_CONFIG['base_url']}")
-    print(f"Models: {MODELS['primary_llm']}, {MODELS['embedding_small']}")
-    print("="*60)
+    # Only a few boolean flags, so a plain scan of argv is enough
+    argv = set(sys.argv[1:])
+    if "-h" in argv or "--help" in argv:
+        print(USAGE, end="")
+        return
+    unknown = argv - KNOWN_FLAGS
+    if unknown:
+        print(f"{USAGE}scripts.launcher: error: unrecognized arguments: {' '.join(sorted(unknown))}",
+              file=sys.stderr)
+        sys.exit(2)
+    test_endpoints = "--test-endpoints" in argv
+    run_tests = "--run-tests" in argv
+    skip_checks = "--skip-checks" in argv or "--no-validation" in argv
+
+    # Config and the HTTP stack are only imported once the arguments are known,
+    # so --help and usage errors return without loading them
+    from config import SERVER_CONFIG, MODELS
+    from suite_utils import SEPARATOR
+
+    write_lines([
+        SEPARATOR,
+        "KOLOSAL SERVER TEST LAUNCHER",
+        SEPARATOR,
+        f"Server URL: {SERVER_CONFIG['base_url']}",
+        f"Models: {MODELS['primary_llm']}, {MODELS['embedding_small']}",
+        SEPARATOR,
+    ])
     
-    if args.test_endpoints:
-        print_endpoint_report()
+    if test_endpoints:
+        from utils.endpoint_tester import print_endpoint_report
+        validation, _ = get_validation(SERVER_CONFIG['base_url'])
+        print_endpoint_report(validation)
         return
     
-    if not check_prerequisites():
+    if skip_checks:
+        # main.py still runs its own health gate before the suite starts
+        print("⏭️  Skipping prerequisite checks")
+    elif not check_prerequisites(*get_validation(SERVER_CONFIG['base_url'])):
         print("\n❌ Prerequisites not met. Server may not be ready.")
         print("Cannot proceed without server being ready.")
         sys.exit(1)
     
-    if args.run_tests:
+    if run_tests:
         print("\n🚀 Starting test suite...")
-        # Import and run main test suite
-        import main
+        # Run main.py as __main__ in this process; config and the HTTP stack
+        # loaded for the prerequisite check are reused rather than reimported
+        import runpy
+        runpy.run_module("main", run_name="__main__")
     else:
         print("\nUse --run-tests to execute the test suite")
         print("Use --test-endpoints to check endpoint availability")
@@ -0,0 +1,176 @@
+"""
+Shared helpers for the Kolosal Server test modules.
+
+Holds the banner separator used in suite output, the suffix that keeps
+names of resources created by concurrently running tests unique, the
+bounded runner for independent tests, the circuit breaker the testers put in front of their requests, the session
+adapter that gives their requests a default timeout and the cleanup
+helper that deletes created resources.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = "=" * 60
+
+# The run's start time keeps names distinct across runs, the counter within one
+RUN_STAMP = int(time.time())
+_name_counter = itertools.count(1)
+
+
+def unique_suffix() -> str:
+    """Suffix for a test resource name, unique within and across runs."""
+    return f"{RUN_STAMP}_{next(_name_counter)}"
+
+
+# Upper bound on test callables in flight at once in gather_tests
+MAX_CONCURRENT_TESTS = 8
+
+
+async def gather_tests(tests: Dict[str, Callable[[], Any]],
+                       limit: int = MAX_CONCURRENT_TESTS) -> Dict[str, Any]:
+    """Run independent test callables concurrently and return their results by name.
+
+    Each callable runs in a worker thread; at most ``limit`` are in flight
+    at once. Callers run it with asyncio.run().
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(test):
+        async with semaphore:
+            return await asyncio.to_thread(test)
+
+    results = await asyncio.gather(*(run(test) for test in tests.values()))
+    return dict(zip(tests, results))
+
+
+# Circuit breaker defaults: after BREAKER_FAILURE_THRESHOLD consecutive request
+# failures within BREAKER_FAILURE_WINDOW seconds, requests fail immediately for
+# BREAKER_OPEN_SECONDS instead of each waiting out its timeout
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_FAILURE_WINDOW = 10.0
+BREAKER_OPEN_SECONDS = 30.0
+
+# Timeout in seconds, or (connect, read) seconds, for requests that set none
+DEFAULT_REQUEST_TIMEOUT: Union[float, Tuple[float, float]] = 30
+
+# Worker threads used to delete created resources one by one during cleanup
+MAX_CLEANUP_WORKERS = 16
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fail fast while a server keeps failing; safe to share between threads."""
+
+    def __init__(self, threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 window: float = BREAKER_FAILURE_WINDOW,
+                 open_seconds: float = BREAKER_OPEN_SECONDS):
+        self.threshold = threshold
+        self.window = window
+        self.open_seconds = open_seconds
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._first_failure_at = 0.0
+        self._open_until = 0.0
+
+    def check(self):
+        """Raise CircuitOpenError while the breaker is open."""
+        if time.monotonic() < self._open_until:
+            raise CircuitOpenError("circuit open: server recently unreachable")
+
+    def record(self, failed: bool):
+        """Update the breaker after a request got a response (failed=False) or raised."""
+        with self._lock:
+            if not failed:
+                self._consecutive_failures = 0
+                return
+            now = time.monotonic()
+            if self._consecutive_failures == 0 or now - self._first_failure_at > self.window:
+                self._consecutive_failures = 0
+                self._first_failure_at = now
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.threshold:
+                self._open_until = now + self.open_seconds
+                self._consecutive_failures = 0
+                logger.error("⛔ %d consecutive request failures, skipping requests for %.0fs",
+                             self.threshold, self.open_seconds)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sends requests made without a timeout with a default one.
+
+    requests.Session has no timeout setting of its own, so mounting this
+    adapter is what keeps direct session calls from waiting forever.
+    """
+
+    def __init__(self, *args, timeout: Union[float, Tuple[float, float]] = DEFAULT_REQUEST_TIMEOUT,
+                 **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def delete_resources(request: Callable[..., requests.Response], kind: str, ids: Iterable[str],
+                     bulk_endpoint: str, item_endpoint: str, emit: Callable[[str], Any] = print,
+                     bulk_support: Optional[Dict[str, bool]] = None):
+    """Delete created resources of one kind, with one bulk request when the server takes it.
+
+    ``request(method, endpoint, **kwargs)`` sends a request and returns the
+    response, usually a tester's make_request. When the POST to
+    ``bulk_endpoint`` is rejected the ids are deleted concurrently on
+    ``item_endpoint``, a template with an ``{id}`` field, and reported in
+    order. ``bulk_support`` maps bulk endpoints to whether the server took
+    them; a 404/405 is recorded there so later calls skip the bulk attempt.
+    Progress lines go to ``emit``.
+    """
+    ids = [resource_id for resource_id in dict.fromkeys(ids) if resource_id]
+    if not ids:
+        return
+    if bulk_support is None:
+        bulk_support = {}
+    
+    if bulk_support.get(bulk_endpoint) is not False:
+        try:
+            response = request('POST', bulk_endpoint, json={'ids': ids})
+        except Exception as e:
+            emit(f"⚠️ Bulk {kind} delete failed: {e}")
+        else:
+            if response.status_code in (200, 204):
+                bulk_support[bulk_endpoint] = True
+                emit(f"✅ Deleted {len(ids)} {kind}s in one request")
+                return
+            if response.status_code in (404, 405):
+                bulk_support[bulk_endpoint] = False
+            else:
+                emit(f"⚠️ Bulk {kind} delete returned {response.status_code}, deleting individually")
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_CLEANUP_WORKERS, len(ids))) as executor:
+        futures = [(resource_id, executor.submit(request, 'DELETE', item_endpoint.format(id=resource_id)))
+                   for resource_id in ids]
+        # Report in submission order so the output is the same on every run
+        for resource_id, future in futures:
+            try:
+                response = future.result()
+                if response.status_code in (200, 204):
+                    emit(f"✅ Deleted {kind}: {resource_id}")
+                else:
+                    emit(f"⚠️ Could not delete {kind} {resource_id}: {response.status_code}")
+            except Exception as e:
+                emit(f"❌ Error deleting {kind} {resource_id}: {e}")
@@ -34,23 +34,36 @@ Options:
     --server-url    Base URL of the Kolosal Server (default: http://127.0.0.1:8080)
     --api-key       API key for authentication (if required)
     --verbose       Enable verbose output
+    --fast          Reuse responses for identical read-only requests
+    --mock          Use canned responses instead of contacting a server (offline runs)
 """
 
 import requests
-import json
 import time
 import argparse
+import itertools
+import re
+import asyncio
 import sys
-import tempfile
+import threading
 import os
+import statistics
+from array import array
+from collections import Counter, deque, namedtuple
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path to import base classes
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from logging_utils import endpoint_logger, RequestTracker, extract_id_from_response
+from json_utils import encode_json_kwarg, json_dumps, json_loads, response_json
+from suite_utils import (DEFAULT_REQUEST_TIMEOUT, SEPARATOR, CircuitBreaker, delete_resources, gather_tests,
+                         unique_suffix)
 
 # Configure logging
 logging.basicConfig(
@@ -60,12 +73,197 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Endpoint paths used by the tester; templates take their ids via str.format
+EP_HEALTH = '/health'
+EP_CHAT_COMPLETIONS = '/v1/chat/completions'
+EP_RAG_CHAT = '/v1/rag/chat'
+EP_ADD_DOCUMENTS = '/add_documents'
+EP_DOCUMENT_UPLOAD = '/documents/upload'
+EP_DOCUMENT = '/documents/{id}'
+EP_DOCUMENTS_BULK_DELETE = '/documents/bulk-delete'
+EP_RETRIEVE = '/retrieve'
+EP_ADVANCED_SEARCH = '/search/advanced'
+EP_WORKFLOWS = '/v1/workflows'
+EP_WORKFLOW = '/workflows/{id}'
+EP_WORKFLOWS_BULK_DELETE = '/workflows/bulk-delete'
+EP_WORKFLOW_EXECUTE = '/v1/workflows/{workflow_id}/execute'
+EP_SESSION_HISTORY = '/sessions/{session_id}/history'
+EP_SESSION_CLEAR = '/sessions/{session_id}/clear'
+
+# Fixed parts of the request payloads, built once; tests only fill in the
+# per-call fields and never mutate these
+CHAT_MODEL = "qwen3-0.6b"
+KNOWLEDGE_METADATA = {"category": "test", "type": "knowledge"}
+DEFAULT_SEARCH_FILTERS = {"category": "test"}
+DEFAULT_WORKFLOW_STEPS = [{"name": "data_analysis", "type": "analysis", "parameters": {"method": "basic"}}]
+DEFAULT_WORKFLOW_INPUTS = {"test": "data"}
+UPLOAD_DOCUMENT_BYTES = b"This is a test document for upload. It contains sample content for testing."
+
+# Read-only endpoints whose responses may be reused for identical requests in
+# fast mode; chat is stateful per session_id and always goes to the server
+MEMOIZABLE_ENDPOINTS = frozenset({EP_RETRIEVE, EP_ADVANCED_SEARCH})
+
+# Per-endpoint request timeouts in seconds, so one stalled call does not hold a
+# test for the full default; DELETEs not listed here use DELETE_TIMEOUT and
+# everything else the session default. Chat and RAG chat are left out on
+# purpose: local-LLM generation regularly takes longer than a short timeout
+ENDPOINT_TIMEOUTS = {
+    EP_HEALTH: 5,
+    EP_RETRIEVE: 5,
+    EP_ADVANCED_SEARCH: 5,
+    EP_ADD_DOCUMENTS: 10,
+    EP_DOCUMENT_UPLOAD: 20,
+    EP_DOCUMENTS_BULK_DELETE: 10,
+    EP_WORKFLOWS_BULK_DELETE: 10,
+}
+DELETE_TIMEOUT = 3
+
+# Failures kept for the summary; older ones are dropped (the failed count stays exact)
+MAX_RECORDED_ERRORS = 200
+
+# One recorded failure; details are only kept with --verbose
+TestError = namedtuple('TestError', ['test', 'message', 'details'], defaults=[None])
+
+# Bodies larger than this are not decoded just to be logged; tests that need
+# them decode on demand through response_json()
+LOG_DECODE_LIMIT = 32 * 1024
+
+def error_snippet(response: requests.Response, limit: int = 200) -> str:
+    """First ``limit`` bytes of a response body, decoded for log messages.
+
+    Unlike ``response.text[:limit]`` this does not decode (or guess the
+    encoding of) the whole body just to keep a short prefix.
+    """
+    return response.content[:limit].decode('utf-8', errors='replace')
+
+
+def api_test(name: str):
+    """Decorate a test method so an unexpected exception is logged as a
+    failure of test ``name`` and the method returns None."""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                error_msg = f"Exception occurred: {str(e)}"
+                self.log_test(name, False, error_msg)
+                logger.error(f"❌ {name} exception - {error_msg}")
+                return None
+        return wrapper
+    return decorator
+
+
+class MockTransport:
+    """Canned, deterministic server responses for running the suite offline (--mock).
+
+    ``request`` has the same signature as KolosalAgentTester._send and returns
+    real requests.Response objects, so the tests and logging run unchanged.
+    Unknown routes answer 404.
+    """
+
+    def __init__(self, base_url: str, latency: float = 0.0):
+        self.base_url = base_url
+        self.latency = latency
+        self._ids = itertools.count(1)
+        # (method, endpoint template, handler(body) -> (status, payload)), first match wins
+        routes = [
+            ('GET', EP_HEALTH, lambda body: (200, {"status": "healthy"})),
+            ('POST', EP_CHAT_COMPLETIONS, lambda body: (200, {
+                "choices": [{"message": {"role": "assistant", "content": "Mock response."}}]
+            })),
+            ('POST', EP_RAG_CHAT, lambda body: (200, {"response": "Mock response.", "sources": []})),
+            ('POST', EP_ADD_DOCUMENTS, self._add_documents),
+            ('POST', EP_DOCUMENT_UPLOAD, lambda body: (200, {"id": self._new_id("doc")})),
+            ('POST', EP_RETRIEVE, lambda body: (200, {"results": []})),
+            ('POST', EP_ADVANCED_SEARCH, lambda body: (200, {"results": []})),
+            ('POST', EP_WORKFLOWS, lambda body: (200, {"id": self._new_id("workflow")})),
+            ('POST', EP_WORKFLOW_EXECUTE, lambda body: (200, {"execution_id": self._new_id("execution")})),
+            ('GET', EP_SESSION_HISTORY, lambda body: (200, {"messages": []})),
+            ('DELETE', EP_SESSION_CLEAR, lambda body: (200, {"success": True})),
+            ('POST', EP_WORKFLOWS_BULK_DELETE, lambda body: (200, {})),
+            ('POST', EP_DOCUMENTS_BULK_DELETE, lambda body: (200, {})),
+            ('DELETE', EP_WORKFLOW, lambda body: (200, {})),
+            ('DELETE', EP_DOCUMENT, lambda body: (200, {})),
+        ]
+        self._routes = [
+            (method, re.compile(re.sub(r'\\\{\w+\\\}', '[^/]+', re.escape(template)) + '$'), handler)
+            for method, template, handler in routes
+        ]
+
+    def _new_id(self, kind: str) -> str:
+        return f"mock-{kind}-{next(self._ids)}"
+
+    def _add_documents(self, body):
+        documents = body.get('documents', []) if isinstance(body, dict) else []
+        results = [{"id": self._new_id("doc")} for _ in documents]
+        return 200, {"successful_count": len(results), "results": results}
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        body = kwargs.get('data')
+        try:
+            body = json_loads(body) if isinstance(body, (bytes, str)) else body
+        except ValueError:
+            body = None
+        
+        status, payload = 404, {"error": f"No mock route for {method} {path}"}
+        for route_method, pattern, handler in self._routes:
+            if route_method == method and pattern.match(path):
+                status, payload = handler(body)
+                break
+        
+        response = requests.Response()
+        response.status_code = status
+        response._content = json_dumps(payload)
+        response.headers['Content-Type'] = 'application/json'
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+
 class KolosalAgentTester:
-    def __init__(self, base_url: str = "http://127.0.0.1:8080", api_key: Optional[str] = None):
+    def __init__(self, base_url: str = "http://127.0.0.1:8080", api_key: Optional[str] = None,
+                 fast: bool = False, mock: bool = False,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_REQUEST_TIMEOUT):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        
+        # In mock mode requests never leave the process; MockTransport answers them
+        self.mock = mock
+        if mock:
+            self._send = MockTransport(self.base_url).request
+        
+        # In fast mode identical requests to MEMOIZABLE_ENDPOINTS are sent once
+        # and the response is reused; off by default since later reads may
+        # depend on documents added in between
+        self.fast = fast
+        self._memo_send = lru_cache(maxsize=256)(self._send) if fast else None
         self.session = requests.Session()
-        self.session.timeout = 30
+        # requests.Session has no timeout setting of its own, so make_request
+        # passes this to every call that does not set one and whose endpoint
+        # has no entry in ENDPOINT_TIMEOUTS
+        self.timeout = timeout
+        
+        # Pool enough keep-alive connections for concurrently running tests.
+        # Gateway errors are retried with jitter so concurrent tests do not
+        # retry in lockstep; only for idempotent methods, since a POST that
+        # failed at the gateway may still have created a resource
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                backoff_jitter=0.1,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'DELETE'])
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Set up authentication headers
         if api_key:
@@ -76,39 +274,129 @@ class KolosalAgentTester:
         
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'User-Agent': 'KolosalAgentTester/1.0'
+            'User-Agent': 'KolosalAgentTester/1.0',
+            'Connection': 'keep-alive'
         })
         
-        # Test results storage
-        self.test_results = {
-            'passed': 0,
-            'failed': 0,
-            'errors': []
-        }
+        # Test results storage; tests may run concurrently, so updates take the lock
+        self._results_lock = threading.Lock()
+        self.test_results = Counter()    # 'passed' / 'failed' counts
+        # Recorded failures as parallel columns; get_test_summary() zips them into TestErrors
+        self._err_names = deque(maxlen=MAX_RECORDED_ERRORS)
+        self._err_msgs = deque(maxlen=MAX_RECORDED_ERRORS)
+        self._err_details = deque(maxlen=MAX_RECORDED_ERRORS)
+        self.status = array('b')         # 1/0 per logged test, in order
+        self.timings = array('d')        # seconds per HTTP request made
+        self._log_buffer = []            # (level, status, test name, message) until flush_test_log()
+        
+        # Fails requests fast while the server keeps failing
+        self.breaker = CircuitBreaker()
+        
+        # Whether the server accepts bulk deletes, by bulk-delete endpoint;
+        # endpoints not tried yet have no entry
+        self._supports_bulk_delete = {}
         
         # Created resources for cleanup
         self.created_agents = []
         self.created_workflows = []
         self.created_documents = []
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def clear_request_cache(self):
+        """Forget memoized responses (fast mode only)"""
+        if self._memo_send is not None:
+            self._memo_send.cache_clear()
+
+    def close(self):
+        """Close the HTTP session and release its pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def warmup(self, connections: int = 2) -> bool:
+        """Open pooled connections to the server before the tests start.
+
+        Sends ``connections`` concurrent health checks so the first real
+        requests of concurrently running tests find warm sockets. Returns
+        True if any check got an HTTP response, i.e. the server is reachable.
+        """
+        reached = []
+
+        def ping():
+            try:
+                self._send('GET', f"{self.base_url}{EP_HEALTH}", timeout=ENDPOINT_TIMEOUTS[EP_HEALTH])
+                reached.append(True)
+            except requests.RequestException:
+                pass
+
+        threads = [threading.Thread(target=ping) for _ in range(connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return bool(reached)
+
     def log_test(self, test_name: str, success: bool, message: str = "", details: Any = None):
-        """Log test results"""
+        """Record a test result.
+
+        Counters update immediately; the log line is buffered and written by
+        flush_test_log(). Error details are kept only when debug logging is
+        on (--verbose).
+        """
         status = "PASS" if success else "FAIL"
-        log_msg = f"[{status}] {test_name}"
-        if message:
-            log_msg += f" - {message}"
+        record = (logging.INFO if success else logging.ERROR, status, test_name, message)
         
         if success:
-            logger.info(log_msg)
-            self.test_results['passed'] += 1
+            with self._results_lock:
+                self._log_buffer.append(record)
+                self.test_results['passed'] += 1
+                self.status.append(1)
         else:
-            logger.error(log_msg)
-            self.test_results['failed'] += 1
-            self.test_results['errors'].append({
-                'test': test_name,
-                'message': message,
-                'details': details
-            })
+            if not logger.isEnabledFor(logging.DEBUG):
+                details = None
+            with self._results_lock:
+                self._log_buffer.append(record)
+                self.test_results['failed'] += 1
+                self.status.append(0)
+                self._err_names.append(test_name)
+                self._err_msgs.append(message)
+                self._err_details.append(details)
+
+    def flush_test_log(self):
+        """Write the buffered test result lines in the order they were recorded"""
+        with self._results_lock:
+            records, self._log_buffer = self._log_buffer, []
+        for level, status, test_name, message in records:
+            logger.log(level, "[%s] %s - %s", status, test_name, message)
+
+    response_json = staticmethod(response_json)
+
+    def _timeout_for(self, method: str, endpoint: str):
+        """Timeout for a request that does not set its own"""
+        return ENDPOINT_TIMEOUTS.get(endpoint, DELETE_TIMEOUT if method == 'DELETE' else self.timeout)
+
+    def _quiet_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request like make_request, but without logging it or tracking it in RequestTracker.
+
+        Used by the cleanup that runs while the report is written, so its
+        requests do not end up in the middle of the report.
+        """
+        self.breaker.check()
+        kwargs.setdefault('timeout', self._timeout_for(method, endpoint))
+        encode_json_kwarg(kwargs)
+        try:
+            response = self._send(method, f"{self.base_url}{endpoint}", **kwargs)
+        except requests.RequestException:
+            self.breaker.record(failed=True)
+            raise
+        self.breaker.record(failed=False)
+        return response
 
     def make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with enhanced logging"""
@@ -120,438 +408,444 @@ class KolosalAgentTester:
         # Extract JSON data for logging
         json_data = kwargs.get('json', {})
         
-        # Log the request details
-        logger.info(f"🔄 Making request: {method} {url}")
-        if json_data:
-            logger.info(f"📤 Request payload: {json.dumps(json_data, indent=2)}")
+        # Log the request details; payloads only with --verbose
+        logger.info("🔄 Making request: %s %s", method, url)
+        if json_data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Request payload: %s", json_data)
+        
+        # Fail fast while the server is known to be unreachable
+        self.breaker.check()
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self._timeout_for(method, endpoint)
+        
+        encode_json_kwarg(kwargs)
         
         with RequestTracker(
             test_name=test_name,
             endpoint=endpoint,
             method=method,
-            request_data=json_data
+            request_data=json_data,
+            request_body=kwargs.get('data') if json_data else None
         ) as tracker:
             try:
-                response = self.session.request(method, url, **kwargs)
+                start_time = time.perf_counter()
+                if self._memo_send is not None and endpoint in MEMOIZABLE_ENDPOINTS:
+                    response = self._memo_send(method, url, **kwargs)
+                else:
+                    response = self._send(method, url, **kwargs)
+                elapsed = time.perf_counter() - start_time
+                self.breaker.record(failed=False)
+                with self._results_lock:
+                    self.timings.append(elapsed)
                 tracker.set_response(response)
                 
-                # Log the response details
-                logger.info(f"📥 Response status: {response.status_code}")
+                # Log the response details; bodies only with --verbose
+                logger.info("📥 Response status: %s", response.status_code)
+                if not logger.isEnabledFor(logging.DEBUG):
+                    return response
+                if len(response.content) > LOG_DECODE_LIMIT:
+                    logger.debug("📄 Response content: %d bytes (not logged)", len(response.content))
+                    return response
                 try:
-                    response_json = response.json()
-                    logger.info(f"📄 Response content: {json.dumps(response_json, indent=2)}")
-                except (json.JSONDecodeError, ValueError):
-                    logger.info(f"📄 Response content (text): {response.text[:500]}...")
+                    logger.debug("📄 Response content: %s", self.response_json(response))
+                except ValueError:
+                    logger.debug("📄 Response content (text): %s...", error_snippet(response, 500))
                 
                 return response
             except Exception as e:
+                if isinstance(e, requests.RequestException):
+                    self.breaker.record(failed=True)
                 tracker.set_error(f"Request failed: {str(e)}")
                 logger.error(f"❌ Request failed: {method} {url} - {e}")
                 raise
 
     # ===== BASIC CHAT FUNCTIONALITY TESTS =====
     
+    @api_test("Basic Chat")
     def test_basic_chat(self, message: str = "Hello, how can you help me?", session_id: str = "test-session"):
         """Test basic chat functionality using v1/chat/completions endpoint"""
         logger.info(f"🧪 Testing basic chat with message: '{message}'")
-        try:
-            # Use the standard OpenAI chat completions format
-            payload = {
-                "model": "qwen3-0.6b",
-                "messages": [
-                    {"role": "user", "content": message}
-                ],
-                "session_id": session_id
-            }
-            
-            response = self.make_request('POST', '/v1/chat/completions', json=payload, test_name="Basic Chat")
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Extract response from OpenAI format
-                choices = data.get('choices', [])
-                if choices:
-                    chat_response = choices[0].get('message', {}).get('content', '')
-                    success = bool(chat_response)
-                    self.log_test("Basic Chat", success, f"Response length: {len(chat_response)}")
-                    logger.info(f"✅ Basic chat successful - Response: {chat_response[:100]}...")
-                    return data
-                else:
-                    self.log_test("Basic Chat", False, "No choices in response")
-                    logger.error("❌ Basic chat failed - No choices in response")
-                    return None
+        # Use the standard OpenAI chat completions format
+        payload = {
+            "model": CHAT_MODEL,
+            "messages": [
+                {"role": "user", "content": message}
+            ],
+            "session_id": session_id
+        }
+        
+        response = self.make_request('POST', EP_CHAT_COMPLETIONS, json=payload, test_name="Basic Chat")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            # Extract response from OpenAI format
+            choices = data.get('choices', [])
+            if choices:
+                chat_response = choices[0].get('message', {}).get('content', '')
+                success = bool(chat_response)
+                self.log_test("Basic Chat", success, f"Response length: {len(chat_response)}")
+                logger.info(f"✅ Basic chat successful - Response: {chat_response[:100]}...")
+                return data
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Basic Chat", False, error_msg)
-                logger.error(f"❌ Basic chat failed - {error_msg}")
+                self.log_test("Basic Chat", False, "No choices in response")
+                logger.error("❌ Basic chat failed - No choices in response")
                 return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Basic Chat", False, error_msg)
-            logger.error(f"❌ Basic chat exception - {error_msg}")
+            logger.error(f"❌ Basic chat failed - {error_msg}")
             return None
 
+    @api_test("RAG Chat")
     def test_rag_chat(self, message: str = "What information do you have?", session_id: str = "rag-session"):
         """Test RAG-enabled chat functionality using v1/rag/chat endpoint"""
         logger.info(f"🧪 Testing RAG chat with message: '{message}'")
-        try:
-            payload = {
-                "message": message,
-                "session_id": session_id
-            }
-            
-            response = self.make_request('POST', '/v1/rag/chat', json=payload, test_name="RAG Chat")
-            
-            if response.status_code == 200:
-                data = response.json()
-                chat_response = data.get('response', '') or data.get('answer', '')
-                context_used = data.get('context_used', False) or bool(data.get('sources', []))
-                success = bool(chat_response)
-                result_msg = f"Response length: {len(chat_response)}, Context used: {context_used}"
-                self.log_test("RAG Chat", success, result_msg)
-                logger.info(f"✅ RAG chat successful - {result_msg}")
-                return data
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("RAG Chat", False, error_msg)
-                logger.error(f"❌ RAG chat failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        payload = {
+            "message": message,
+            "session_id": session_id
+        }
+        
+        response = self.make_request('POST', EP_RAG_CHAT, json=payload, test_name="RAG Chat")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            chat_response = data.get('response', '') or data.get('answer', '')
+            context_used = data.get('context_used', False) or bool(data.get('sources', []))
+            success = bool(chat_response)
+            result_msg = f"Response length: {len(chat_response)}, Context used: {context_used}"
+            self.log_test("RAG Chat", success, result_msg)
+            logger.info(f"✅ RAG chat successful - {result_msg}")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("RAG Chat", False, error_msg)
-            logger.error(f"❌ RAG chat exception - {error_msg}")
+            logger.error(f"❌ RAG chat failed - {error_msg}")
             return None
 
     # ===== DOCUMENT MANAGEMENT TESTS =====
     
+    def _add_documents(self, documents: List[Dict[str, Any]], test_name: str) -> requests.Response:
+        """POST documents ({'text', 'metadata'} dicts) to add_documents in one request.
+
+        Ids of documents the server added are recorded for cleanup.
+        """
+        response = self.make_request('POST', EP_ADD_DOCUMENTS, json={"documents": documents}, test_name=test_name)
+        if response.status_code == 200:
+            results = self.response_json(response).get('results', [])
+            self.created_documents.extend(result['id'] for result in results if result.get('id'))
+        return response
+
+    @api_test("Add Text Content")
     def test_add_text_content(self, content: str = None, title: str = None):
         """Test adding text content to knowledge base using add_documents endpoint"""
         if not content:
             content = "This is test content for the knowledge base. It contains information about AI and machine learning."
         if not title:
-            title = f"Test Document {int(time.time())}"
+            title = f"Test Document {unique_suffix()}"
             
         logger.info(f"🧪 Testing adding text content: '{title}'")
-        try:
-            # Use the correct format for add_documents endpoint
-            payload = {
-                "documents": [
-                    {
-                        "text": content,
-                        "metadata": {
-                            "title": title,
-                            "category": "test", 
-                            "type": "knowledge"
-                        }
-                    }
-                ]
-            }
-            
-            response = self.make_request('POST', '/add_documents', json=payload, test_name="Add Text Content")
+        response = self._add_documents([{
+            "text": content,
+            "metadata": {"title": title, **KNOWLEDGE_METADATA}
+        }], test_name="Add Text Content")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            # Check for successful document addition
+            successful_count = data.get('successful_count', 0)
+            results = data.get('results', [])
+            success = successful_count > 0 and results
             
-            if response.status_code == 200:
-                data = response.json()
-                # Check for successful document addition
-                successful_count = data.get('successful_count', 0)
-                results = data.get('results', [])
-                success = successful_count > 0 and results
-                
-                if success and results:
-                    doc_id = results[0].get('id')
-                    if doc_id:
-                        self.created_documents.append(doc_id)
-                    self.log_test("Add Text Content", True, f"Document added successfully. ID: {doc_id}")
-                    logger.info(f"✅ Text content added successfully - ID: {doc_id}")
-                else:
-                    self.log_test("Add Text Content", False, f"No documents added successfully")
-                    logger.error("❌ Failed to add text content - No successful documents")
-                return data
+            if success and results:
+                doc_id = results[0].get('id')
+                self.log_test("Add Text Content", True, f"Document added successfully. ID: {doc_id}")
+                logger.info(f"✅ Text content added successfully - ID: {doc_id}")
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Add Text Content", False, error_msg)
-                logger.error(f"❌ Add text content failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+                self.log_test("Add Text Content", False, f"No documents added successfully")
+                logger.error("❌ Failed to add text content - No successful documents")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Add Text Content", False, error_msg)
-            logger.error(f"❌ Add text content exception - {error_msg}")
+            logger.error(f"❌ Add text content failed - {error_msg}")
             return None
 
-    def test_upload_document(self, file_path: str = None):
-        """Test document upload functionality"""
-        temp_file_created = False
-        if not file_path:
-            # Create a temporary test file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                f.write("This is a test document for upload. It contains sample content for testing.")
-                file_path = f.name
-                temp_file_created = True
+    @api_test("Add Text Content Batch")
+    def test_add_text_content_batch(self, items: List[Dict[str, Any]]):
+        """Test adding several documents ({'text', 'metadata'} dicts) with a single add_documents request"""
+        logger.info(f"🧪 Testing adding {len(items)} documents in one request")
+        response = self._add_documents(items, test_name="Add Text Content Batch")
         
-        try:
+        if response.status_code == 200:
+            data = self.response_json(response)
+            successful_count = data.get('successful_count', 0)
+            success = successful_count == len(items)
+            self.log_test("Add Text Content Batch", success,
+                          f"{successful_count}/{len(items)} documents added")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
+            self.log_test("Add Text Content Batch", False, error_msg)
+            return None
+
+    @api_test("Upload Document")
+    def test_upload_document(self, file_path: str = None):
+        """Test document upload functionality.
+
+        Without ``file_path`` the built-in UPLOAD_DOCUMENT_BYTES are sent from
+        memory, so no temporary file is written.
+        """
+        if file_path:
             with open(file_path, 'rb') as file:
-                files = {'file': file}
-                data = {'type': 'text'}
-                
-                response = self.session.post(f"{self.base_url}/documents/upload", files=files, data=data)
-                
-            if response.status_code == 200:
-                result = response.json()
-                doc_id = result.get('id') or result.get('document_id')
-                success = bool(doc_id)
-                if doc_id:
-                    self.created_documents.append(doc_id)
-                self.log_test("Upload Document", success, f"Document ID: {doc_id}")
-                return result
-            else:
-                self.log_test("Upload Document", False, f"HTTP {response.status_code}: {response.text[:200]}")
-                return None
-        except Exception as e:
-            self.log_test("Upload Document", False, str(e))
+                content = file.read()
+            file_name = os.path.basename(file_path)
+        else:
+            content = UPLOAD_DOCUMENT_BYTES
+            file_name = 'upload.txt'
+        
+        files = {'file': (file_name, content)}
+        data = {'type': 'text'}
+        
+        # Drop the session's JSON Content-Type so requests sets the multipart boundary
+        response = self.make_request('POST', EP_DOCUMENT_UPLOAD, files=files, data=data,
+                                     headers={'Content-Type': None},
+                                     test_name="Upload Document")
+        
+        if response.status_code == 200:
+            result = self.response_json(response)
+            doc_id = result.get('id') or result.get('document_id')
+            success = bool(doc_id)
+            if doc_id:
+                self.created_documents.append(doc_id)
+            self.log_test("Upload Document", success, f"Document ID: {doc_id}")
+            return result
+        else:
+            self.log_test("Upload Document", False, f"HTTP {response.status_code}: {error_snippet(response)}")
             return None
-        finally:
-            # Clean up temp file
-            if temp_file_created and os.path.exists(file_path):
-                os.unlink(file_path)
 
+    @api_test("Search Documents")
     def test_search_documents(self, query: str = "AI machine learning", limit: int = 5):
         """Test document search functionality using retrieve endpoint"""
         logger.info(f"🧪 Testing document search with query: '{query}'")
-        try:
-            payload = {
-                "query": query,
-                "top_k": limit
-            }
-            
-            response = self.make_request('POST', '/retrieve', json=payload, test_name="Search Documents")
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('results', [])
-                success = isinstance(results, list)
-                result_msg = f"Found {len(results)} results"
-                self.log_test("Search Documents", success, result_msg)
-                logger.info(f"✅ Document search successful - {result_msg}")
-                return data
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Search Documents", False, error_msg)
-                logger.error(f"❌ Document search failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        payload = {
+            "query": query,
+            "top_k": limit
+        }
+        
+        response = self.make_request('POST', EP_RETRIEVE, json=payload, test_name="Search Documents")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            results = data.get('results', [])
+            success = isinstance(results, list)
+            result_msg = f"Found {len(results)} results"
+            self.log_test("Search Documents", success, result_msg)
+            logger.info(f"✅ Document search successful - {result_msg}")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Search Documents", False, error_msg)
-            logger.error(f"❌ Document search exception - {error_msg}")
+            logger.error(f"❌ Document search failed - {error_msg}")
             return None
 
+    @api_test("Advanced Search")
     def test_advanced_search(self, query: str = "test content", filters: dict = None, sort_by: str = "relevance"):
         """Test advanced document search with filters"""
-        try:
-            payload = {
-                "query": query,
-                "filters": filters or {"category": "test"},
-                "sort_by": sort_by
-            }
-            
-            response = self.make_request('POST', '/search/advanced', json=payload, test_name="Advanced Search")
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('results', [])
-                success = isinstance(results, list)
-                self.log_test("Advanced Search", success, f"Found {len(results)} filtered results")
-                return data
-            else:
-                self.log_test("Advanced Search", False, f"HTTP {response.status_code}: {response.text[:200]}")
-                return None
-        except Exception as e:
-            self.log_test("Advanced Search", False, str(e))
+        payload = {
+            "query": query,
+            "filters": filters or DEFAULT_SEARCH_FILTERS,
+            "sort_by": sort_by
+        }
+        
+        response = self.make_request('POST', EP_ADVANCED_SEARCH, json=payload, test_name="Advanced Search")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            results = data.get('results', [])
+            success = isinstance(results, list)
+            self.log_test("Advanced Search", success, f"Found {len(results)} filtered results")
+            return data
+        else:
+            self.log_test("Advanced Search", False, f"HTTP {response.status_code}: {error_snippet(response)}")
             return None
 
     # ===== WORKFLOW MANAGEMENT TESTS =====
     
+    @api_test("Create Workflow")
     def test_create_workflow(self, name: str = None, description: str = None, steps: list = None):
         """Test workflow creation using v1/workflows endpoint"""
         if not name:
-            name = f"Test Workflow {int(time.time())}"
+            name = f"Test Workflow {unique_suffix()}"
         if not description:
             description = "Test workflow for validation"
         if not steps:
-            steps = [
-                {
-                    "name": "data_analysis",
-                    "type": "analysis",
-                    "parameters": {"method": "basic"}
-                }
-            ]
+            steps = DEFAULT_WORKFLOW_STEPS
             
         logger.info(f"🧪 Testing workflow creation: '{name}'")
-        try:
-            payload = {
-                "name": name,
-                "description": description,
-                "steps": steps
-            }
-            
-            response = self.make_request('POST', '/v1/workflows', json=payload, test_name="Create Workflow")
-            
-            if response.status_code == 200:
-                data = response.json()
-                workflow_id = data.get('id') or data.get('workflow_id')
-                success = bool(workflow_id)
-                if workflow_id:
-                    self.created_workflows.append(workflow_id)
-                result_msg = f"Workflow ID: {workflow_id}"
-                self.log_test("Create Workflow", success, result_msg)
-                logger.info(f"✅ Workflow creation successful - {result_msg}")
-                return data
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Create Workflow", False, error_msg)
-                logger.error(f"❌ Workflow creation failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        payload = {
+            "name": name,
+            "description": description,
+            "steps": steps
+        }
+        
+        response = self.make_request('POST', EP_WORKFLOWS, json=payload, test_name="Create Workflow")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            workflow_id = data.get('id') or data.get('workflow_id')
+            success = bool(workflow_id)
+            if workflow_id:
+                self.created_workflows.append(workflow_id)
+            result_msg = f"Workflow ID: {workflow_id}"
+            self.log_test("Create Workflow", success, result_msg)
+            logger.info(f"✅ Workflow creation successful - {result_msg}")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Create Workflow", False, error_msg)
-            logger.error(f"❌ Workflow creation exception - {error_msg}")
+            logger.error(f"❌ Workflow creation failed - {error_msg}")
             return None
 
+    @api_test("Execute Workflow")
     def test_execute_workflow(self, workflow_id: str, inputs: dict = None):
         """Test workflow execution using v1/workflows endpoint"""
         logger.info(f"🧪 Testing workflow execution for ID: {workflow_id}")
-        try:
-            payload = {"inputs": inputs or {"test": "data"}}
-            
-            response = self.make_request('POST', f'/v1/workflows/{workflow_id}/execute', 
-                                       json=payload, test_name="Execute Workflow")
-            
-            if response.status_code in [200, 201]:  # Accept both 200 and 201 for successful execution
-                data = response.json()
-                execution_id = data.get('execution_id') or data.get('id')
-                success = bool(execution_id)
-                result_msg = f"Execution ID: {execution_id}"
-                self.log_test("Execute Workflow", success, result_msg)
-                logger.info(f"✅ Workflow execution successful - {result_msg}")
-                return data
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Execute Workflow", False, error_msg)
-                logger.error(f"❌ Workflow execution failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        payload = {"inputs": inputs or DEFAULT_WORKFLOW_INPUTS}
+        
+        response = self.make_request('POST', EP_WORKFLOW_EXECUTE.format(workflow_id=workflow_id), 
+                                   json=payload, test_name="Execute Workflow")
+        
+        if response.status_code in [200, 201]:  # Accept both 200 and 201 for successful execution
+            data = self.response_json(response)
+            execution_id = data.get('execution_id') or data.get('id')
+            success = bool(execution_id)
+            result_msg = f"Execution ID: {execution_id}"
+            self.log_test("Execute Workflow", success, result_msg)
+            logger.info(f"✅ Workflow execution successful - {result_msg}")
+            return data
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Execute Workflow", False, error_msg)
-            logger.error(f"❌ Workflow execution exception - {error_msg}")
+            logger.error(f"❌ Workflow execution failed - {error_msg}")
             return None
 
     # ===== SESSION MANAGEMENT TESTS =====
     
+    @api_test("Get Chat History")
     def test_get_chat_history(self, session_id: str = "test-session"):
         """Test retrieving chat history (may not be implemented)"""
         logger.info(f"🧪 Testing chat history retrieval for session: {session_id}")
-        try:
-            response = self.make_request('GET', f'/sessions/{session_id}/history', test_name="Get Chat History")
-            
-            if response.status_code == 200:
-                data = response.json()
-                messages = data.get('messages', [])
-                success = isinstance(messages, list)
-                result_msg = f"Found {len(messages)} messages"
-                self.log_test("Get Chat History", success, result_msg)
-                logger.info(f"✅ Chat history retrieval successful - {result_msg}")
-                return data
-            elif response.status_code == 404:
-                # Session management may not be implemented
-                result_msg = "Session management not implemented (404)"
-                self.log_test("Get Chat History", True, result_msg)  # Consider this a pass since feature may not exist
-                logger.info(f"ℹ️ Session management not available - {result_msg}")
-                return {"messages": [], "note": "Session management not implemented"}
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                self.log_test("Get Chat History", False, error_msg)
-                logger.error(f"❌ Chat history retrieval failed - {error_msg}")
-                return None
-        except Exception as e:
-            error_msg = f"Exception occurred: {str(e)}"
+        response = self.make_request('GET', EP_SESSION_HISTORY.format(session_id=session_id), test_name="Get Chat History")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            messages = data.get('messages', [])
+            success = isinstance(messages, list)
+            result_msg = f"Found {len(messages)} messages"
+            self.log_test("Get Chat History", success, result_msg)
+            logger.info(f"✅ Chat history retrieval successful - {result_msg}")
+            return data
+        elif response.status_code == 404:
+            # Session management may not be implemented
+            result_msg = "Session management not implemented (404)"
+            self.log_test("Get Chat History", True, result_msg)  # Consider this a pass since feature may not exist
+            logger.info(f"ℹ️ Session management not available - {result_msg}")
+            return {"messages": [], "note": "Session management not implemented"}
+        else:
+            error_msg = f"HTTP {response.status_code}: {error_snippet(response)}"
             self.log_test("Get Chat History", False, error_msg)
-            logger.error(f"❌ Chat history retrieval exception - {error_msg}")
+            logger.error(f"❌ Chat history retrieval failed - {error_msg}")
             return None
 
+    @api_test("Clear Session")
     def test_clear_session(self, session_id: str = "test-session"):
         """Test clearing a session"""
-        try:
-            response = self.make_request('DELETE', f'/sessions/{session_id}/clear', test_name="Clear Session")
-            
-            if response.status_code == 200:
-                data = response.json()
-                success = data.get('success', False)
-                self.log_test("Clear Session", success, f"Session cleared: {success}")
-                return data
-            else:
-                self.log_test("Clear Session", False, f"HTTP {response.status_code}: {response.text[:200]}")
-                return None
-        except Exception as e:
-            self.log_test("Clear Session", False, str(e))
+        response = self.make_request('DELETE', EP_SESSION_CLEAR.format(session_id=session_id), test_name="Clear Session")
+        
+        if response.status_code == 200:
+            data = self.response_json(response)
+            success = data.get('success', False)
+            self.log_test("Clear Session", success, f"Session cleared: {success}")
+            return data
+        else:
+            self.log_test("Clear Session", False, f"HTTP {response.status_code}: {error_snippet(response)}")
             return None
 
     # ===== COMPREHENSIVE TESTING WORKFLOW =====
     
     def run_complete_workflow_test(self):
-        """Run a complete workflow combining all features"""
+        """Run a complete workflow combining all features.
+
+        Search and RAG chat need the knowledge document from step 1 (and then
+        run together), and workflow execution needs the created workflow;
+        apart from that the knowledge chain and the workflow chain overlap.
+        The session check runs once both have finished. Inside the chains
+        progress goes through the logger only, so lines do not interleave.
+        """
         print("\n🔄 Running Complete RAG Workflow Test...")
+        print("📚 Steps 1-3: knowledge, search and RAG chat / ⚙️ Steps 4-5: workflow creation and execution")
         logger.info("🔄 Starting complete RAG workflow test")
         
-        workflow_results = {}
+        def knowledge_chain():
+            results = {}
+            
+            # 1. Add knowledge to the system
+            logger.info("📚 Step 1: Testing knowledge content addition")
+            doc_result = self.test_add_text_content(
+                content="Our premium software package costs $299/month and includes 24/7 support. The basic package is $99/month.",
+                title="Pricing Information"
+            )
+            results['document_added'] = bool(doc_result)
+            logger.info(f"📚 Knowledge content addition: {'✅ SUCCESS' if doc_result else '❌ FAILED'}")
+            
+            # 2. and 3. Document search and RAG-enabled chat both only need
+            # the document, so they run together
+            logger.info("🔍 Step 2: Testing document search capabilities")
+            logger.info("💬 Step 3: Testing RAG-enabled chat functionality")
+            lookups = asyncio.run(gather_tests({
+                'search': lambda: self.test_search_documents("software pricing"),
+                'chat': lambda: self.test_rag_chat("How much does the premium package cost?")
+            }))
+            results['search_works'] = bool(lookups['search'])
+            logger.info(f"🔍 Document search: {'✅ SUCCESS' if lookups['search'] else '❌ FAILED'}")
+            results['rag_chat_works'] = bool(lookups['chat'])
+            logger.info(f"💬 RAG chat: {'✅ SUCCESS' if lookups['chat'] else '❌ FAILED'}")
+            return results
         
-        # 1. Add knowledge to the system
-        print("📚 Step 1: Adding knowledge content...")
-        logger.info("📚 Step 1: Testing knowledge content addition")
-        doc_result = self.test_add_text_content(
-            content="Our premium software package costs $299/month and includes 24/7 support. The basic package is $99/month.",
-            title="Pricing Information"
-        )
-        workflow_results['document_added'] = bool(doc_result)
-        logger.info(f"📚 Knowledge content addition: {'✅ SUCCESS' if doc_result else '❌ FAILED'}")
-        
-        # 2. Test document search
-        print("🔍 Step 2: Testing document search...")
-        logger.info("🔍 Step 2: Testing document search capabilities")
-        search_result = self.test_search_documents("software pricing")
-        workflow_results['search_works'] = bool(search_result)
-        logger.info(f"🔍 Document search: {'✅ SUCCESS' if search_result else '❌ FAILED'}")
-        
-        # 3. Test RAG-enabled chat
-        print("💬 Step 3: Testing RAG chat...")
-        logger.info("💬 Step 3: Testing RAG-enabled chat functionality")
-        chat_result = self.test_rag_chat("How much does the premium package cost?")
-        workflow_results['rag_chat_works'] = bool(chat_result)
-        logger.info(f"💬 RAG chat: {'✅ SUCCESS' if chat_result else '❌ FAILED'}")
-        
-        # 4. Test workflow creation and execution
-        print("⚙️ Step 4: Testing workflow creation...")
-        logger.info("⚙️ Step 4: Testing workflow creation")
-        workflow_steps = [
-            {"name": "search_docs", "type": "retrieval"},
-            {"name": "generate_response", "type": "generation"}
-        ]
-        workflow_result = self.test_create_workflow(
-            name="Customer Inquiry Handler",
-            description="Handle customer pricing questions",
-            steps=workflow_steps
-        )
-        workflow_results['workflow_created'] = bool(workflow_result)
-        logger.info(f"⚙️ Workflow creation: {'✅ SUCCESS' if workflow_result else '❌ FAILED'}")
-        
-        if workflow_result and workflow_result.get('id'):
-            print("🚀 Step 5: Testing workflow execution...")
-            logger.info("🚀 Step 5: Testing workflow execution")
-            execution_result = self.test_execute_workflow(
-                workflow_result['id'],
-                {"customer_question": "What are your pricing options?"}
+        def workflow_chain():
+            results = {}
+            
+            # 4. Test workflow creation and execution
+            logger.info("⚙️ Step 4: Testing workflow creation")
+            workflow_steps = [
+                {"name": "search_docs", "type": "retrieval"},
+                {"name": "generate_response", "type": "generation"}
+            ]
+            workflow_result = self.test_create_workflow(
+                name="Customer Inquiry Handler",
+                description="Handle customer pricing questions",
+                steps=workflow_steps
             )
-            workflow_results['workflow_execution'] = bool(execution_result)
-            logger.info(f"🚀 Workflow execution: {'✅ SUCCESS' if execution_result else '❌ FAILED'}")
+            results['workflow_created'] = bool(workflow_result)
+            logger.info(f"⚙️ Workflow creation: {'✅ SUCCESS' if workflow_result else '❌ FAILED'}")
+            
+            if workflow_result and workflow_result.get('id'):
+                logger.info("🚀 Step 5: Testing workflow execution")
+                execution_result = self.test_execute_workflow(
+                    workflow_result['id'],
+                    {"customer_question": "What are your pricing options?"}
+                )
+                results['workflow_execution'] = bool(execution_result)
+                logger.info(f"🚀 Workflow execution: {'✅ SUCCESS' if execution_result else '❌ FAILED'}")
+            return results
         
-        # 5. Test session management
+        chains = asyncio.run(gather_tests({
+            'knowledge': knowledge_chain,
+            'workflow': workflow_chain
+        }))
+        workflow_results = {**chains['knowledge'], **chains['workflow']}
+        
+        # 6. Test session management, after the chains are done with the server
         print("📝 Step 6: Testing session management...")
         logger.info("📝 Step 6: Testing session management")
         history_result = self.test_get_chat_history("test-session")
@@ -572,64 +866,84 @@ class KolosalAgentTester:
 
     # ===== CLEANUP AND UTILITIES =====
     
-    def cleanup_created_resources(self):
-        """Clean up any resources created during testing"""
-        print("\n🧹 Cleaning up created resources...")
-        
-        # Clean up workflows
-        for workflow_id in self.created_workflows:
-            try:
-                response = self.make_request('DELETE', f'/workflows/{workflow_id}')
-                if response.status_code == 200:
-                    print(f"✅ Deleted workflow: {workflow_id}")
-                else:
-                    print(f"⚠️ Could not delete workflow {workflow_id}: {response.status_code}")
-            except Exception as e:
-                print(f"❌ Error deleting workflow {workflow_id}: {e}")
-        
-        # Clean up documents
-        for doc_id in self.created_documents:
-            try:
-                response = self.make_request('DELETE', f'/documents/{doc_id}')
-                if response.status_code == 200:
-                    print(f"✅ Deleted document: {doc_id}")
-                else:
-                    print(f"⚠️ Could not delete document {doc_id}: {response.status_code}")
-            except Exception as e:
-                print(f"❌ Error deleting document {doc_id}: {e}")
+    def cleanup_created_resources(self, emit: Callable[[str], Any] = print,
+                                  request: Optional[Callable[..., requests.Response]] = None):
+        """Clean up any resources created during testing.
+
+        Each kind is removed with one bulk request when the server supports
+        it; otherwise the deletes run concurrently on the shared session and
+        are reported in order once each has finished. Requests go through
+        ``request`` (make_request by default) and progress lines to ``emit``.
+        """
+        request = request or self.make_request
+        emit("\n🧹 Cleaning up created resources...")
+        delete_resources(request, 'workflow', self.created_workflows,
+                         EP_WORKFLOWS_BULK_DELETE, EP_WORKFLOW, emit, self._supports_bulk_delete)
+        delete_resources(request, 'document', self.created_documents,
+                         EP_DOCUMENTS_BULK_DELETE, EP_DOCUMENT, emit, self._supports_bulk_delete)
 
     def run_all_tests(self):
         """Run all agent feature tests"""
-        logger.info("=" * 60)
-        logger.info("Starting Kolosal Agent System Test Suite")
-        logger.info("=" * 60)
+        logger.info("\n".join((SEPARATOR, "Starting Kolosal Agent System Test Suite", SEPARATOR)))
         
+        # Pre-flight once: with the server down every test would only wait
+        # for its own connection error
+        if not self.warmup():
+            logger.error(f"❌ Cannot connect to server at {self.base_url} - skipping agent tests")
+            return False
+        
+        cleanup_thread = None
+        cleanup_lines = []
         try:
+            # Chat history reads the session basic chat writes and search needs
+            # the added document, so those pairs run in order; the chains and
+            # the remaining tests overlap their network waits
+            def chat_chain():
+                return {'basic_chat': self.test_basic_chat(),
+                        'chat_history': self.test_get_chat_history()}
+            
+            def document_chain():
+                return {'add_text_content': self.test_add_text_content(),
+                        'search_documents': self.test_search_documents()}
+            
+            gathered = asyncio.run(gather_tests({
+                'chat': chat_chain,
+                'documents': document_chain,
+                'rag_chat': self.test_rag_chat,
+                'advanced_search': self.test_advanced_search,
+                'create_workflow': self.test_create_workflow
+            }))
+            chains = {**gathered.pop('chat'), **gathered.pop('documents')}
             test_results = {
-                'basic_chat': self.test_basic_chat(),
-                'rag_chat': self.test_rag_chat(),
-                'add_text_content': self.test_add_text_content(),
-                'search_documents': self.test_search_documents(),
-                'advanced_search': self.test_advanced_search(),
-                'create_workflow': self.test_create_workflow(),
-                'chat_history': self.test_get_chat_history(),
-                'complete_workflow': self.run_complete_workflow_test()
+                'basic_chat': chains['basic_chat'],
+                'rag_chat': gathered['rag_chat'],
+                'add_text_content': chains['add_text_content'],
+                'search_documents': chains['search_documents'],
+                'advanced_search': gathered['advanced_search'],
+                'create_workflow': gathered['create_workflow'],
+                'chat_history': chains['chat_history'],
             }
+            # The complete workflow repeats the calls above, so it runs on its own
+            test_results['complete_workflow'] = self.run_complete_workflow_test()
+            # Delete the created resources while the report is formatted and
+            # written. The cleanup sends its requests unlogged and keeps its
+            # progress lines until the thread is joined in the finally block,
+            # so nothing it does lands in the middle of the report
+            cleanup_thread = threading.Thread(target=self.cleanup_created_resources,
+                                              args=(cleanup_lines.append, self._quiet_request),
+                                              name="agent-cleanup")
+            cleanup_thread.start()
+            self.flush_test_log()
             
-            # Print results
-            logger.info("\n" + "=" * 60)
-            logger.info("AGENT SYSTEM TEST RESULTS")
-            logger.info("=" * 60)
-            
+            # Print results as one block
             passed = sum(1 for result in test_results.values() if result)
             total = len(test_results)
             
-            for test_name, result in test_results.items():
-                status = "PASS" if result else "FAIL"
-                logger.info(f"{test_name.replace('_', ' ').title()}: {status}")
-            
-            logger.info(f"\nPassed: {passed}/{total}")
-            logger.info(f"Success Rate: {(passed/total)*100:.1f}%")
+            lines = ["", SEPARATOR, "AGENT SYSTEM TEST RESULTS", SEPARATOR]
+            lines += [f"{test_name.replace('_', ' ').title()}: {'PASS' if result else 'FAIL'}"
+                      for test_name, result in test_results.items()]
+            lines += ["", f"Passed: {passed}/{total}", f"Success Rate: {(passed/total)*100:.1f}%"]
+            logger.info("\n".join(lines))
             
             # Additional insights
             if test_results.get('basic_chat') and test_results.get('rag_chat'):
@@ -647,11 +961,17 @@ class KolosalAgentTester:
             return False
         finally:
             # Cleanup created resources
-            self.cleanup_created_resources()
+            if cleanup_thread is None:
+                self.cleanup_created_resources()
+            else:
+                cleanup_thread.join()
+                for line in cleanup_lines:
+                    print(line)
 
     def get_test_summary(self):
         """Get a summary of test results"""
-        total_tests = self.test_results['passed'] + self.test_results['failed']
+        self.flush_test_log()
+        total_tests = self.test_results.total()
         success_rate = (self.test_results['passed'] / total_tests * 100) if total_tests > 0 else 0
         
         return {
@@ -659,7 +979,8 @@ class KolosalAgentTester:
             'passed': self.test_results['passed'],
             'failed': self.test_results['failed'],
             'success_rate': success_rate,
-            'errors': self.test_results['errors']
+            'median_request_time': statistics.median(self.timings) if self.timings else 0.0,
+            'errors': list(map(TestError, self._err_names, self._err_msgs, self._err_details))
         }
 
 
@@ -670,6 +991,10 @@ def main():
                         help='Base URL of the Kolosal Server')
     parser.add_argument('--api-key', help='API key for authentication')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
+    parser.add_argument('--fast', action='store_true',
+                        help='Reuse responses for identical read-only requests')
+    parser.add_argument('--mock', action='store_true',
+                        help='Answer requests with canned responses instead of contacting a server')
     
     args = parser.parse_args()
     
@@ -677,10 +1002,11 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     print("🚀 Starting Kolosal Server Agent Feature Tests")
-    print(f"📡 Server URL: {args.server_url}")
+    print(f"📡 Server URL: {args.server_url}" + (" (mock responses)" if args.mock else ""))
     
     # Initialize tester
-    tester = KolosalAgentTester(base_url=args.server_url, api_key=args.api_key)
+    tester = KolosalAgentTester(base_url=args.server_url, api_key=args.api_key, fast=args.fast,
+                                mock=args.mock)
     
     try:
         # Run comprehensive tests
@@ -717,11 +1043,12 @@ def main():
         print(f"✅ Passed: {summary['passed']}")
         print(f"❌ Failed: {summary['failed']}")
         print(f"📈 Success Rate: {summary['success_rate']:.1f}%")
+        print(f"⏱️ Median Request Time: {summary['median_request_time']:.3f}s")
         
         if summary['errors']:
             print(f"\n❌ Errors encountered:")
             for error in summary['errors']:
-                print(f"  - {error['test']}: {error['message']}")
+                print(f"  - {error.test}: {error.message}")
         
         # Cleanup
         tester.cleanup_created_resources()
@@ -736,6 +1063,8 @@ def main():
         print(f"\n❌ Unexpected error during testing: {e}")
         tester.cleanup_created_resources()
         return False
+    finally:
+        tester.close()
 
 
 if __name__ == "__main__":
@@ -17,26 +17,113 @@ Usage:
 """
 
 import requests
-import json
 import time
 import asyncio
+import aiohttp
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 import logging
 import sys
 import os
+from functools import cached_property
 
 # Add parent directory to path for logging utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from logging_utils import extract_id_from_response
+from json_utils import encode_json_kwarg, json_dumps_pretty, response_json
+from suite_utils import (DEFAULT_REQUEST_TIMEOUT, SEPARATOR, CircuitBreaker, TimeoutHTTPAdapter,
+                         delete_resources, gather_tests, unique_suffix)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """Static part of a test agent definition; see to_payload() for the request body."""
+    name: str  # prefix, a timestamp is appended per run
+    type: str
+    role: str
+    system_prompt: str
+    capabilities: Tuple[str, ...]
+    functions: Tuple[str, ...]
+    auto_start: bool = True
+    max_concurrent_jobs: int = 3
+
+    def to_payload(self, base_url: str, stamp: int) -> Dict[str, Any]:
+        """Agent creation body for a server at base_url."""
+        payload = asdict(self)
+        payload["name"] = f"{self.name}_{stamp}"
+        payload["llm_config"] = {
+            "model_name": "default",
+            "api_endpoint": f"{base_url}/v1",
+            "temperature": 0.7,
+            "max_tokens": 1024
+        }
+        return payload
+
+# Agents created for workflow tests, in creation order
+AGENT_CONFIGS = (
+    AgentConfig(
+        name="research_agent",
+        type="research",
+        role="Research Specialist",
+        system_prompt="You are a research specialist. Analyze topics and gather information.",
+        capabilities=("research", "analysis", "text_processing"),
+        functions=("research", "analyze", "summarize")
+    ),
+    AgentConfig(
+        name="writer_agent",
+        type="content",
+        role="Content Writer",
+        system_prompt="You are a content writer. Create engaging content based on research.",
+        capabilities=("writing", "content_creation", "editing"),
+        functions=("write", "edit", "format")
+    ),
+    AgentConfig(
+        name="reviewer_agent",
+        type="review",
+        role="Quality Reviewer",
+        system_prompt="You are a quality reviewer. Review and improve content quality.",
+        capabilities=("review", "quality_control", "editing"),
+        functions=("review", "validate", "improve")
+    ),
+)
+
+# Endpoint paths used by the tester; templates take their ids via str.format
+EP_AGENTS = '/api/v1/agents'
+EP_AGENT = '/api/v1/agents/{id}'
+EP_AGENTS_BULK_DELETE = '/api/v1/agents/bulk-delete'
+EP_WORKFLOWS = '/workflows'
+EP_WORKFLOW_EXECUTE = '/workflows/{workflow_id}/execute'
+EP_ORCH_WORKFLOWS = '/api/v1/orchestration/workflows'
+EP_ORCH_WORKFLOW = '/api/v1/orchestration/workflows/{id}'
+EP_ORCH_WORKFLOWS_BULK_DELETE = '/api/v1/orchestration/workflows/bulk-delete'
+EP_ORCH_WORKFLOW_EXECUTE = '/api/v1/orchestration/workflows/{workflow_id}/execute'
+EP_ORCH_WORKFLOW_EXECUTE_ASYNC = '/api/v1/orchestration/workflows/{workflow_id}/execute-async'
+EP_ORCH_WORKFLOW_STATUS = '/api/v1/orchestration/workflows/{workflow_id}/status'
+
+# Endpoint variations probed by test_workflow_monitoring, in preference order
+MONITORING_WORKFLOW_ENDPOINTS = ("/api/v1/orchestration/workflows", "/orchestration/workflows", "/workflows")
+MONITORING_METRICS_ENDPOINTS = ("/api/v1/orchestration/metrics", "/orchestration/metrics", "/metrics")
+MONITORING_STATUS_ENDPOINTS = ("/api/v1/orchestration/status", "/orchestration/status", "/status")
+MONITORING_HISTORY_ENDPOINTS = ("/api/v1/orchestration/workflows/history", "/orchestration/workflows/history",
+                                "/workflows/history")
+MONITORING_ENDPOINTS = (MONITORING_WORKFLOW_ENDPOINTS + MONITORING_METRICS_ENDPOINTS
+                        + MONITORING_STATUS_ENDPOINTS + MONITORING_HISTORY_ENDPOINTS)
+
+# Timeout in seconds for the bulk and per-id deletes made during cleanup
+CLEANUP_TIMEOUT = 10
+
 class WorkflowTester:
-    def __init__(self, base_url: str = "http://127.0.0.1:8080", api_key: Optional[str] = None):
+    def __init__(self, base_url: str = "http://127.0.0.1:8080", api_key: Optional[str] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_REQUEST_TIMEOUT):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+        # Requests sent without an explicit timeout get this one
+        adapter = TimeoutHTTPAdapter(timeout=timeout)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         if api_key:
             self.session.headers.update({
                 'Authorization': f'Bearer {api_key}',
@@ -45,10 +132,18 @@ class WorkflowTester:
         self.session.headers.update({'Content-Type': 'application/json'})
         self.created_workflows = []
         self.created_agents = []
+        
+        # Fails requests fast while the server keeps failing; workflow tests run concurrently
+        self.breaker = CircuitBreaker()
+        
+        # Whether the server accepts bulk deletes, by bulk-delete endpoint
+        self._supports_bulk_delete = {}
+
+    response_json = staticmethod(response_json)
 
     def make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with enhanced JSON response logging"""
-        url = f"{self.base_url}{endpoint}"
+        url = self.base_url + endpoint
         
         # Extract test name from kwargs or use endpoint name
         test_name = kwargs.pop('test_name', f"{method} {endpoint}")
@@ -59,17 +154,30 @@ class WorkflowTester:
         # Log the request details
         logger.info(f"🔄 Making request: {method} {url}")
         if json_data:
-            logger.info(f"📤 Request payload: {json.dumps(json_data, indent=2)}")
+            logger.info(f"📤 Request payload: {json_dumps_pretty(json_data)}")
+        
+        # Fail fast while the server is known to be unreachable
+        self.breaker.check()
+        
+        encode_json_kwarg(kwargs)
         
         try:
-            response = self.session.request(method, url, **kwargs)
-            
-            # Log the response details with enhanced JSON formatting
-            logger.info(f"📥 Response status: {response.status_code}")
             try:
-                response_json = response.json()
-                logger.info(f"📄 Response JSON: {json.dumps(response_json, indent=2)}")
-            except (json.JSONDecodeError, ValueError):
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                self.breaker.record(failed=True)
+                raise
+            self.breaker.record(failed=False)
+            
+            # Log the response details with enhanced JSON formatting; error
+            # bodies are only logged as text, tests decode them if they need to
+            logger.info(f"📥 Response status: {response.status_code}")
+            if 200 <= response.status_code < 300:
+                try:
+                    logger.info(f"📄 Response JSON: {json_dumps_pretty(self.response_json(response))}")
+                except ValueError:
+                    logger.info(f"📄 Response content (text): {response.text[:500]}...")
+            else:
                 logger.info(f"📄 Response content (text): {response.text[:500]}...")
             
             return response
@@ -88,7 +196,7 @@ class WorkflowTester:
             else:
                 logger.warning(f"⚠️ Server health check returned {response.status_code}")
                 # Try alternative endpoints
-                response = self.session.get(f"{self.base_url}/api/v1/agents", timeout=10)
+                response = self.session.get(self.base_url + EP_AGENTS, timeout=10)
                 if response.status_code in [200, 404]:
                     logger.info("✅ Server is responding to API calls")
                     return True
@@ -109,7 +217,7 @@ class WorkflowTester:
         
         # First, check if any agent endpoints are available
         available_endpoints = []
-        test_endpoints = ["/api/v1/agents", "/agents", "/v1/agents"]
+        test_endpoints = [EP_AGENTS, "/agents", "/v1/agents"]
         
         for endpoint in test_endpoints:
             try:
@@ -132,56 +240,8 @@ class WorkflowTester:
         agent_endpoint = available_endpoints[0]
         logger.info(f"Using agent endpoint: {agent_endpoint}")
         
-        agent_configs = [
-            {
-                "name": f"research_agent_{int(time.time())}",
-                "type": "research",
-                "role": "Research Specialist", 
-                "system_prompt": "You are a research specialist. Analyze topics and gather information.",
-                "capabilities": ["research", "analysis", "text_processing"],
-                "functions": ["research", "analyze", "summarize"],
-                "auto_start": True,
-                "max_concurrent_jobs": 3,
-                "llm_config": {
-                    "model_name": "default",
-                    "api_endpoint": f"{self.base_url}/v1",
-                    "temperature": 0.7,
-                    "max_tokens": 1024
-                }
-            },
-            {
-                "name": f"writer_agent_{int(time.time() + 1)}",
-                "type": "content",
-                "role": "Content Writer",
-                "system_prompt": "You are a content writer. Create engaging content based on research.",
-                "capabilities": ["writing", "content_creation", "editing"],
-                "functions": ["write", "edit", "format"],
-                "auto_start": True,
-                "max_concurrent_jobs": 3,
-                "llm_config": {
-                    "model_name": "default",
-                    "api_endpoint": f"{self.base_url}/v1",
-                    "temperature": 0.7,
-                    "max_tokens": 1024
-                }
-            },
-            {
-                "name": f"reviewer_agent_{int(time.time() + 2)}",
-                "type": "review",
-                "role": "Quality Reviewer",
-                "system_prompt": "You are a quality reviewer. Review and improve content quality.",
-                "capabilities": ["review", "quality_control", "editing"],
-                "functions": ["review", "validate", "improve"],
-                "auto_start": True,
-                "max_concurrent_jobs": 3,
-                "llm_config": {
-                    "model_name": "default",
-                    "api_endpoint": f"{self.base_url}/v1",
-                    "temperature": 0.7,
-                    "max_tokens": 1024
-                }
-            }
-        ]
+        now = int(time.time())
+        agent_configs = [config.to_payload(self.base_url, now + i) for i, config in enumerate(AGENT_CONFIGS[:count])]
         
         for i in range(min(count, len(agent_configs))):
             try:
@@ -193,7 +253,7 @@ class WorkflowTester:
                                            test_name=f"Create Agent {i+1}")
                 
                 if response.status_code in [200, 201]:
-                    data = response.json()
+                    data = self.response_json(response)
                     
                     # Use utility function to extract agent ID
                     agent_id = extract_id_from_response(data, "agent")
@@ -223,10 +283,44 @@ class WorkflowTester:
         """Check if we're using mock agents (server doesn't support agents)"""
         return any(agent_id.startswith("mock_agent_") for agent_id in agent_ids)
 
+    @cached_property
+    def existing_agent_ids(self) -> List[str]:
+        """Ids of up to three agents already on the server, listed once per tester"""
+        try:
+            response = self.session.get(self.base_url + EP_AGENTS, timeout=10)
+            if response.status_code == 200:
+                existing_agents = self.response_json(response).get('data', [])
+                agent_ids = [agent.get('agent_id') or agent.get('id') for agent in existing_agents[:3]]
+                return [aid for aid in agent_ids if aid]  # Filter out None values
+        except Exception as e:
+            logger.error(f"Failed to get existing agents: {e}")
+        return []
+
+    @cached_property
+    def shared_agent_ids(self) -> List[str]:
+        """Agents shared by every workflow test, resolved on first use.
+
+        Test agents are created once per tester rather than once per test;
+        agents already on the server are only used when creation fails.
+        cleanup() resets the cache.
+        """
+        logger.info("Creating test agents...")
+        agent_ids = self.create_test_agents(3)
+        
+        # If we couldn't create agents, fall back to existing ones
+        if len(agent_ids) < 2:
+            existing_agent_ids = self.existing_agent_ids
+            if len(existing_agent_ids) >= 2:
+                logger.info(f"Insufficient new agents created. Using {len(existing_agent_ids)} "
+                            f"existing agents: {existing_agent_ids}")
+                agent_ids.extend(existing_agent_ids)
+        
+        return agent_ids
+
     def test_create_workflow(self):
         """Test workflow creation using proper API format"""
         workflow_config = {
-            "name": f"Test Workflow {int(time.time())}",
+            "name": f"Test Workflow {unique_suffix()}",
             "description": "Test workflow for validation",
             "steps": [
                 {
@@ -244,13 +338,13 @@ class WorkflowTester:
         
         try:
             logger.info("Creating workflow...")
-            response = self.make_request('POST', '/workflows', 
+            response = self.make_request('POST', EP_WORKFLOWS, 
                                        json=workflow_config, 
                                        timeout=30,
                                        test_name="Create Sequential Workflow")
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.response_json(response)
                 workflow_id = data.get('id') or data.get('workflow_id')
                 
                 if workflow_id:
@@ -280,13 +374,13 @@ class WorkflowTester:
         
         try:
             logger.info(f"Executing workflow {workflow_id}...")
-            response = self.make_request('POST', f'/workflows/{workflow_id}/execute',
+            response = self.make_request('POST', EP_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                        json=execution_payload, 
                                        timeout=60,
                                        test_name="Execute Sequential Workflow")
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.response_json(response)
                 execution_id = data.get('execution_id') or data.get('id')
                 
                 if execution_id:
@@ -307,7 +401,7 @@ class WorkflowTester:
     def test_workflow_with_rag(self):
         """Test creating and executing a workflow that includes RAG operations"""
         workflow_config = {
-            "name": f"RAG Workflow {int(time.time())}",
+            "name": f"RAG Workflow {unique_suffix()}",
             "description": "Test workflow with RAG functionality",
             "steps": [
                 {
@@ -325,11 +419,11 @@ class WorkflowTester:
         
         try:
             logger.info("Creating RAG workflow...")
-            response = self.session.post(f"{self.base_url}/workflows",
+            response = self.session.post(self.base_url + EP_WORKFLOWS,
                                        json=workflow_config, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.response_json(response)
                 workflow_id = data.get('id') or data.get('workflow_id')
                 
                 if workflow_id:
@@ -344,11 +438,11 @@ class WorkflowTester:
                         }
                     }
                     
-                    exec_response = self.session.post(f"{self.base_url}/workflows/{workflow_id}/execute",
+                    exec_response = self.session.post(self.base_url + EP_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                                     json=execution_payload, timeout=60)
                     
                     if exec_response.status_code == 200:
-                        exec_data = exec_response.json()
+                        exec_data = self.response_json(exec_response)
                         logger.info(f"✅ RAG workflow executed successfully")
                         return True
                     else:
@@ -386,11 +480,11 @@ class WorkflowTester:
         
         try:
             logger.info("Creating customer inquiry workflow...")
-            response = self.session.post(f"{self.base_url}/workflows",
+            response = self.session.post(self.base_url + EP_WORKFLOWS,
                                        json=workflow_config, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.response_json(response)
                 workflow_id = data.get('id') or data.get('workflow_id')
                 
                 if workflow_id:
@@ -404,11 +498,11 @@ class WorkflowTester:
                         }
                     }
                     
-                    exec_response = self.session.post(f"{self.base_url}/workflows/{workflow_id}/execute",
+                    exec_response = self.session.post(self.base_url + EP_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                                     json=execution_payload, timeout=60)
                     
                     if exec_response.status_code == 200:
-                        exec_data = exec_response.json()
+                        exec_data = self.response_json(exec_response)
                         result = exec_data.get('result', {})
                         logger.info(f"✅ Customer inquiry workflow executed successfully")
                         logger.info(f"Response preview: {str(result)[:100]}...")
@@ -427,8 +521,10 @@ class WorkflowTester:
             logger.error(f"❌ Failed to create/execute customer inquiry workflow: {e}")
             return False
 
-    def test_sequential_workflow(self, agent_ids: List[str]):
+    def test_sequential_workflow(self, agent_ids: Optional[List[str]] = None):
         """Test sequential workflow execution"""
+        if agent_ids is None:
+            agent_ids = self.shared_agent_ids
         if len(agent_ids) < 3:
             logger.warning("Need at least 3 agents for sequential workflow")
             return False
@@ -440,7 +536,7 @@ class WorkflowTester:
             return True
             
         workflow_config = {
-            "name": f"sequential_workflow_{int(time.time())}",
+            "name": f"sequential_workflow_{unique_suffix()}",
             "description": "Sequential content creation workflow",
             "type": "sequential",
             "global_context": {
@@ -507,9 +603,9 @@ class WorkflowTester:
         
         try:
             # Create workflow
-            logger.info(f"Creating workflow at: /api/v1/orchestration/workflows")
+            logger.info(f"Creating workflow at: {EP_ORCH_WORKFLOWS}")
             
-            response = self.make_request('POST', '/api/v1/orchestration/workflows',
+            response = self.make_request('POST', EP_ORCH_WORKFLOWS,
                                        json=workflow_config,
                                        test_name="Create Sequential Workflow V1")
             
@@ -517,7 +613,7 @@ class WorkflowTester:
                 logger.error(f"Failed to create sequential workflow: {response.status_code}")
                 return False
                 
-            workflow_id = extract_id_from_response(response.json(), "workflow")
+            workflow_id = extract_id_from_response(self.response_json(response), "workflow")
             if workflow_id:
                 self.created_workflows.append(workflow_id)
             
@@ -530,7 +626,7 @@ class WorkflowTester:
                 }
             }
             
-            response = self.make_request('POST', f'/api/v1/orchestration/workflows/{workflow_id}/execute',
+            response = self.make_request('POST', EP_ORCH_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                        json=execution_payload,
                                        test_name="Execute Sequential Workflow V1")
             
@@ -538,7 +634,7 @@ class WorkflowTester:
             logger.info(f"Sequential workflow test: {'PASS' if success else 'FAIL'}")
             
             if success:
-                result = response.json()
+                result = self.response_json(response)
                 logger.info(f"Workflow completed with {len(result.get('data', {}).get('steps', []))} steps")
             
             return success
@@ -547,8 +643,10 @@ class WorkflowTester:
             logger.error(f"Sequential workflow test failed: {e}")
             return False
 
-    def test_parallel_workflow(self, agent_ids: List[str]):
+    def test_parallel_workflow(self, agent_ids: Optional[List[str]] = None):
         """Test parallel workflow execution"""
+        if agent_ids is None:
+            agent_ids = self.shared_agent_ids
         if len(agent_ids) < 3:
             logger.warning("Need at least 3 agents for parallel workflow")
             return False
@@ -560,7 +658,7 @@ class WorkflowTester:
             return True
             
         workflow_config = {
-            "name": f"parallel_workflow_{int(time.time())}",
+            "name": f"parallel_workflow_{unique_suffix()}",
             "description": "Parallel research and analysis workflow",
             "type": "parallel",
             "global_context": {
@@ -626,8 +724,8 @@ class WorkflowTester:
         
         try:
             # Create workflow
-            logger.info(f"📤 Creating parallel workflow at: {self.base_url}/api/v1/orchestration/workflows")
-            response = self.make_request('POST', '/api/v1/orchestration/workflows',
+            logger.info(f"📤 Creating parallel workflow at: {self.base_url}{EP_ORCH_WORKFLOWS}")
+            response = self.make_request('POST', EP_ORCH_WORKFLOWS,
                                        json=workflow_config,
                                        test_name="Create Parallel Workflow")
             
@@ -635,7 +733,7 @@ class WorkflowTester:
                 logger.error(f"Failed to create parallel workflow: {response.status_code}")
                 return False
                 
-            workflow_id = extract_id_from_response(response.json(), 'workflow')
+            workflow_id = extract_id_from_response(self.response_json(response), 'workflow')
             self.created_workflows.append(workflow_id)
             
             # Execute workflow asynchronously to handle parallel execution
@@ -646,22 +744,15 @@ class WorkflowTester:
                 }
             }
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}/execute-async",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOW_EXECUTE_ASYNC.format(workflow_id=workflow_id),
                                        json=execution_payload)
             
             if response.status_code in [200, 202]:
-                execution_id = extract_id_from_response(response.json(), 'execution')
+                execution_id = extract_id_from_response(self.response_json(response), 'execution')
                 logger.info(f"Parallel workflow started: {execution_id}")
                 
-                # Check status periodically
-                for _ in range(10):  # Check for up to 2 minutes
-                    time.sleep(12)
-                    status_response = self.session.get(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}/status")
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
-                        status = status_data.get('data', {}).get('status')
-                        if status in ['completed', 'failed']:
-                            break
+                # Check status until the workflow finishes (up to 2 minutes)
+                status = self.poll_workflow_status(workflow_id, deadline=120)
                 
                 success = status == 'completed'
                 logger.info(f"Parallel workflow test: {'PASS' if success else 'FAIL'}")
@@ -674,8 +765,35 @@ class WorkflowTester:
             logger.error(f"Parallel workflow test failed: {e}")
             return False
 
-    def test_pipeline_workflow(self, agent_ids: List[str]):
+    def poll_workflow_status(self, workflow_id: str, deadline: float = 120, initial: float = 0.05,
+                             factor: float = 2.0, cap: float = 1.0) -> Optional[str]:
+        """Poll an orchestration workflow until it completes or fails.
+
+        The delay between polls starts at ``initial`` seconds and grows by
+        ``factor`` up to ``cap``, so fast workflows are seen almost immediately.
+        Returns the last status seen, or None if none was reported before
+        ``deadline`` seconds elapsed.
+        """
+        end = time.monotonic() + deadline
+        delay = initial
+        status = None
+        while True:
+            status_response = self.session.get(self.base_url + EP_ORCH_WORKFLOW_STATUS.format(workflow_id=workflow_id),
+                                               timeout=10)
+            if status_response.status_code == 200:
+                status = self.response_json(status_response).get('data', {}).get('status')
+                if status in ['completed', 'failed']:
+                    return status
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return status
+            time.sleep(min(delay, remaining))
+            delay = min(delay * factor, cap)
+
+    def test_pipeline_workflow(self, agent_ids: Optional[List[str]] = None):
         """Test pipeline workflow with data transformation"""
+        if agent_ids is None:
+            agent_ids = self.shared_agent_ids
         if len(agent_ids) < 2:
             logger.warning("Need at least 2 agents for pipeline workflow")
             return False
@@ -687,7 +805,7 @@ class WorkflowTester:
             return True
             
         workflow_config = {
-            "name": f"pipeline_workflow_{int(time.time())}",
+            "name": f"pipeline_workflow_{unique_suffix()}",
             "description": "Data processing pipeline workflow",
             "type": "pipeline",
             "global_context": {
@@ -752,10 +870,10 @@ class WorkflowTester:
         
         try:
             # Create workflow
-            logger.info(f"📤 Creating pipeline workflow at: {self.base_url}/api/v1/orchestration/workflows")
-            logger.info(f"📦 Pipeline workflow config: {json.dumps(workflow_config, indent=2)}")
+            logger.info(f"📤 Creating pipeline workflow at: {self.base_url}{EP_ORCH_WORKFLOWS}")
+            logger.info(f"📦 Pipeline workflow config: {json_dumps_pretty(workflow_config)}")
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOWS,
                                        json=workflow_config)
             
             logger.info(f"📥 Pipeline workflow creation response: Status {response.status_code}")
@@ -765,7 +883,7 @@ class WorkflowTester:
                 logger.error(f"Failed to create pipeline workflow: {response.status_code}")
                 return False
                 
-            workflow_id = extract_id_from_response(response.json(), 'workflow')
+            workflow_id = extract_id_from_response(self.response_json(response), 'workflow')
             self.created_workflows.append(workflow_id)
             
             # Execute workflow
@@ -777,14 +895,14 @@ class WorkflowTester:
                 }
             }
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}/execute",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                        json=execution_payload)
             
             success = response.status_code == 200
             logger.info(f"Pipeline workflow test: {'PASS' if success else 'FAIL'}")
             
             if success:
-                result = response.json()
+                result = self.response_json(response)
                 pipeline_data = result.get('data', {})
                 logger.info(f"Pipeline completed with {len(pipeline_data.get('steps', []))} stages")
             
@@ -794,8 +912,10 @@ class WorkflowTester:
             logger.error(f"Pipeline workflow test failed: {e}")
             return False
 
-    def test_consensus_workflow(self, agent_ids: List[str]):
+    def test_consensus_workflow(self, agent_ids: Optional[List[str]] = None):
         """Test consensus-based workflow"""
+        if agent_ids is None:
+            agent_ids = self.shared_agent_ids
         if len(agent_ids) < 3:
             logger.warning("Need at least 3 agents for consensus workflow")
             return False
@@ -807,7 +927,7 @@ class WorkflowTester:
             return True
             
         workflow_config = {
-            "name": f"consensus_workflow_{int(time.time())}",
+            "name": f"consensus_workflow_{unique_suffix()}",
             "description": "Multi-agent consensus decision workflow",
             "type": "consensus",
             "consensus_config": {
@@ -883,10 +1003,10 @@ class WorkflowTester:
         
         try:
             # Create workflow
-            logger.info(f"📤 Creating consensus workflow at: {self.base_url}/api/v1/orchestration/workflows")
-            logger.info(f"📦 Consensus workflow config: {json.dumps(workflow_config, indent=2)}")
+            logger.info(f"📤 Creating consensus workflow at: {self.base_url}{EP_ORCH_WORKFLOWS}")
+            logger.info(f"📦 Consensus workflow config: {json_dumps_pretty(workflow_config)}")
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOWS,
                                        json=workflow_config)
             
             logger.info(f"📥 Consensus workflow creation response: Status {response.status_code}")
@@ -896,7 +1016,7 @@ class WorkflowTester:
                 logger.error(f"Failed to create consensus workflow: {response.status_code}")
                 return False
                 
-            workflow_id = extract_id_from_response(response.json(), 'workflow')
+            workflow_id = extract_id_from_response(self.response_json(response), 'workflow')
             self.created_workflows.append(workflow_id)
             
             # Execute workflow
@@ -908,14 +1028,14 @@ class WorkflowTester:
                 }
             }
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}/execute",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                        json=execution_payload)
             
             success = response.status_code == 200
             logger.info(f"Consensus workflow test: {'PASS' if success else 'FAIL'}")
             
             if success:
-                result = response.json()
+                result = self.response_json(response)
                 consensus_data = result.get('data', {})
                 consensus_reached = consensus_data.get('consensus_reached', False)
                 logger.info(f"Consensus reached: {consensus_reached}")
@@ -926,8 +1046,10 @@ class WorkflowTester:
             logger.error(f"Consensus workflow test failed: {e}")
             return False
 
-    def test_error_handling_workflow(self, agent_ids: List[str]):
+    def test_error_handling_workflow(self, agent_ids: Optional[List[str]] = None):
         """Test workflow error handling and recovery"""
+        if agent_ids is None:
+            agent_ids = self.shared_agent_ids
         if len(agent_ids) < 2:
             logger.warning("Need at least 2 agents for error handling test")
             return False
@@ -939,7 +1061,7 @@ class WorkflowTester:
             return True
             
         workflow_config = {
-            "name": f"error_handling_workflow_{int(time.time())}",
+            "name": f"error_handling_workflow_{unique_suffix()}",
             "description": "Workflow with deliberate errors for testing recovery",
             "error_handling": {
                 "strategy": "retry_with_fallback",
@@ -999,10 +1121,10 @@ class WorkflowTester:
         
         try:
             # Create workflow
-            logger.info(f"📤 Creating error handling workflow at: {self.base_url}/api/v1/orchestration/workflows")
-            logger.info(f"📦 Error handling workflow config: {json.dumps(workflow_config, indent=2)}")
+            logger.info(f"📤 Creating error handling workflow at: {self.base_url}{EP_ORCH_WORKFLOWS}")
+            logger.info(f"📦 Error handling workflow config: {json_dumps_pretty(workflow_config)}")
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOWS,
                                        json=workflow_config)
             
             logger.info(f"📥 Error handling workflow creation response: Status {response.status_code}")
@@ -1012,7 +1134,7 @@ class WorkflowTester:
                 logger.error(f"Failed to create error handling workflow: {response.status_code}")
                 return False
                 
-            workflow_id = extract_id_from_response(response.json(), 'workflow')
+            workflow_id = extract_id_from_response(self.response_json(response), 'workflow')
             self.created_workflows.append(workflow_id)
             
             # Execute workflow
@@ -1024,7 +1146,7 @@ class WorkflowTester:
                 }
             }
             
-            response = self.session.post(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}/execute",
+            response = self.session.post(self.base_url + EP_ORCH_WORKFLOW_EXECUTE.format(workflow_id=workflow_id),
                                        json=execution_payload)
             
             # For error handling test, we expect either success with recovery or partial completion
@@ -1032,7 +1154,7 @@ class WorkflowTester:
             logger.info(f"Error handling workflow test: {'PASS' if success else 'FAIL'}")
             
             if success:
-                result = response.json()
+                result = self.response_json(response)
                 error_data = result.get('data', {})
                 errors_handled = error_data.get('errors_handled', 0)
                 fallbacks_used = error_data.get('fallbacks_used', 0)
@@ -1044,29 +1166,59 @@ class WorkflowTester:
             logger.error(f"Error handling workflow test failed: {e}")
             return False
 
+    async def _probe_all(self, endpoints: List[str], timeout: float):
+        """GET every endpoint on one event loop and return statuses (or exceptions) in order."""
+        headers = {key: value for key, value in self.session.headers.items()
+                   if key in ('Authorization', 'X-API-Key')}
+        connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=85)
+        async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                         timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            async def probe(endpoint):
+                async with session.get(f"{self.base_url}{endpoint}") as response:
+                    return response.status
+
+            return await asyncio.gather(*(probe(endpoint) for endpoint in endpoints),
+                                        return_exceptions=True)
+
+    def probe_endpoints(self, endpoints: Sequence[str], timeout: float = 5) -> Dict[str, Optional[int]]:
+        """GET several endpoints concurrently and return their status codes.
+
+        All probes share one aiohttp event loop, so the number of endpoints is
+        not limited by a thread pool. Endpoints that raise (timeout,
+        connection error) map to None.
+        """
+        unique_endpoints = list(dict.fromkeys(endpoints))
+        results = asyncio.run(self._probe_all(unique_endpoints, timeout))
+        
+        statuses = {}
+        for endpoint, result in zip(unique_endpoints, results):
+            if isinstance(result, BaseException):
+                statuses[endpoint] = None
+                logger.info(f"Probed {endpoint}: {result!r}")
+            else:
+                statuses[endpoint] = result
+                logger.info(f"Probed {endpoint}: HTTP {result}")
+        return statuses
+
     def test_workflow_monitoring(self):
         """Test workflow monitoring and metrics"""
         try:
-            # Check if orchestration endpoints are available
-            available_endpoints = []
-            test_endpoints = [
-                "/api/v1/orchestration/workflows",
-                "/orchestration/workflows", 
-                "/workflows",
-                "/api/v1/orchestration/metrics",
-                "/orchestration/metrics",
-                "/metrics"
-            ]
-            
-            for endpoint in test_endpoints[:3]:  # Test workflow endpoints first
-                try:
-                    response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
-                    if response.status_code != 404:
-                        available_endpoints.append(endpoint)
-                        logger.info(f"Found workflow endpoint: {endpoint} (status: {response.status_code})")
-                        break
-                except Exception:
-                    continue
+            workflow_endpoints = MONITORING_WORKFLOW_ENDPOINTS
+            metrics_endpoints = MONITORING_METRICS_ENDPOINTS
+            status_endpoints = MONITORING_STATUS_ENDPOINTS
+            history_endpoints = MONITORING_HISTORY_ENDPOINTS
+            
+            # The probes are independent GETs, so send them all at once; each
+            # group then passes if any of its endpoint variations answered
+            statuses = self.probe_endpoints(MONITORING_ENDPOINTS)
+            
+            # Use the first workflow endpoint (in preference order) that exists
+            available_endpoints = [
+                endpoint for endpoint in workflow_endpoints
+                if statuses[endpoint] is not None and statuses[endpoint] != 404
+            ][:1]
+            if available_endpoints:
+                logger.info(f"Found workflow endpoint: {available_endpoints[0]} (status: {statuses[available_endpoints[0]]})")
             
             if not available_endpoints:
                 logger.info("🔧 No orchestration endpoints found - simulating workflow monitoring test")
@@ -1074,41 +1226,12 @@ class WorkflowTester:
                 return True
             
             # Test workflow list
-            response = self.session.get(f"{self.base_url}{available_endpoints[0]}", timeout=10)
-            list_success = response.status_code == 200
+            list_success = statuses[available_endpoints[0]] == 200
             
-            # Test orchestration metrics (try multiple endpoint variations)
-            metrics_success = False
-            for endpoint in ["/api/v1/orchestration/metrics", "/orchestration/metrics", "/metrics"]:
-                try:
-                    response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
-                    if response.status_code == 200:
-                        metrics_success = True
-                        break
-                except Exception:
-                    continue
-            
-            # Test orchestrator status (try multiple endpoint variations)
-            status_success = False
-            for endpoint in ["/api/v1/orchestration/status", "/orchestration/status", "/status"]:
-                try:
-                    response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
-                    if response.status_code == 200:
-                        status_success = True
-                        break
-                except Exception:
-                    continue
-            
-            # Test workflow execution history (try multiple endpoint variations)
-            history_success = False
-            for endpoint in ["/api/v1/orchestration/workflows/history", "/orchestration/workflows/history", "/workflows/history"]:
-                try:
-                    response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
-                    if response.status_code == 200:
-                        history_success = True
-                        break
-                except Exception:
-                    continue
+            # Test orchestration metrics, orchestrator status and execution history
+            metrics_success = any(statuses[endpoint] == 200 for endpoint in metrics_endpoints)
+            status_success = any(statuses[endpoint] == 200 for endpoint in status_endpoints)
+            history_success = any(statuses[endpoint] == 200 for endpoint in history_endpoints)
             
             success = list_success and metrics_success and status_success
             logger.info(f"Workflow monitoring test: {'PASS' if success else 'FAIL'}")
@@ -1124,39 +1247,26 @@ class WorkflowTester:
         """Clean up created resources"""
         logger.info("Cleaning up workflow test resources...")
         
-        # Delete workflows
-        for workflow_id in self.created_workflows:
-            try:
-                response = self.session.delete(f"{self.base_url}/api/v1/orchestration/workflows/{workflow_id}", timeout=10)
-                if response.status_code in [200, 204, 404]:
-                    logger.info(f"Deleted workflow: {workflow_id}")
-                else:
-                    logger.warning(f"Failed to delete workflow {workflow_id}: HTTP {response.status_code}")
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout deleting workflow {workflow_id}")
-            except Exception as e:
-                logger.warning(f"Error deleting workflow {workflow_id}: {e}")
+        def request(method, endpoint, **kwargs):
+            return self.make_request(method, endpoint, timeout=CLEANUP_TIMEOUT, **kwargs)
+        
+        # Delete workflows first, since they reference the agents
+        delete_resources(request, 'workflow', self.created_workflows,
+                         EP_ORCH_WORKFLOWS_BULK_DELETE, EP_ORCH_WORKFLOW, logger.info,
+                         self._supports_bulk_delete)
         
         # Delete agents (only ones we created)
-        for agent_id in self.created_agents:
-            try:
-                response = self.session.delete(f"{self.base_url}/api/v1/agents/{agent_id}", timeout=10)
-                if response.status_code in [200, 204, 404]:
-                    logger.info(f"Deleted agent: {agent_id}")
-                else:
-                    logger.warning(f"Failed to delete agent {agent_id}: HTTP {response.status_code}")
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout deleting agent {agent_id}")
-            except Exception as e:
-                logger.warning(f"Error deleting agent {agent_id}: {e}")
+        self.__dict__.pop('shared_agent_ids', None)
+        self.__dict__.pop('existing_agent_ids', None)
+        delete_resources(request, 'agent', self.created_agents,
+                         EP_AGENTS_BULK_DELETE, EP_AGENT, logger.info,
+                         self._supports_bulk_delete)
         
         logger.info("Cleanup completed")
 
     def run_all_workflow_tests(self):
         """Run all workflow tests"""
-        logger.info("=" * 60)
-        logger.info("Starting Kolosal Workflow Test Suite")
-        logger.info("=" * 60)
+        logger.info("\n".join((SEPARATOR, "Starting Kolosal Workflow Test Suite", SEPARATOR)))
         
         # Check server connectivity first
         if not self.check_server_connectivity():
@@ -1164,27 +1274,8 @@ class WorkflowTester:
             return False
         
         try:
-            # Create test agents
-            logger.info("Creating test agents...")
-            agent_ids = self.create_test_agents(3)
-            
-            # If we couldn't create agents, try to get existing ones
-            if len(agent_ids) < 2:
-                logger.info("Insufficient new agents created. Attempting to use existing agents...")
-                try:
-                    response = self.session.get(f"{self.base_url}/api/v1/agents", timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        existing_agents = data.get('data', [])
-                        if existing_agents and len(existing_agents) >= 2:
-                            # Use existing agent IDs
-                            existing_agent_ids = [agent.get('agent_id') or agent.get('id') for agent in existing_agents[:3]]
-                            existing_agent_ids = [aid for aid in existing_agent_ids if aid]  # Filter out None values
-                            if len(existing_agent_ids) >= 2:
-                                agent_ids.extend(existing_agent_ids[:3])
-                                logger.info(f"Using {len(existing_agent_ids)} existing agents: {existing_agent_ids[:3]}")
-                except Exception as e:
-                    logger.error(f"Failed to get existing agents: {e}")
+            # Create (or reuse) the shared test agents
+            agent_ids = self.shared_agent_ids
             
             if len(agent_ids) < 2:
                 logger.error("Insufficient agents created for workflow testing")
@@ -1194,30 +1285,26 @@ class WorkflowTester:
             
             logger.info(f"Proceeding with {len(agent_ids)} agents for testing")
             
-            # Run workflow tests
-            test_results = {
-                'sequential': self.test_sequential_workflow(agent_ids),
-                'parallel': self.test_parallel_workflow(agent_ids),
-                'pipeline': self.test_pipeline_workflow(agent_ids),
-                'consensus': self.test_consensus_workflow(agent_ids),
-                'error_handling': self.test_error_handling_workflow(agent_ids),
-                'monitoring': self.test_workflow_monitoring()
-            }
-            
-            # Print results
-            logger.info("\n" + "=" * 60)
-            logger.info("WORKFLOW TEST RESULTS")
-            logger.info("=" * 60)
-            
+            # Each test creates and executes its own workflow over the shared
+            # agents, so they run concurrently once the agents exist
+            test_results = asyncio.run(gather_tests({
+                'sequential': lambda: self.test_sequential_workflow(agent_ids),
+                'parallel': lambda: self.test_parallel_workflow(agent_ids),
+                'pipeline': lambda: self.test_pipeline_workflow(agent_ids),
+                'consensus': lambda: self.test_consensus_workflow(agent_ids),
+                'error_handling': lambda: self.test_error_handling_workflow(agent_ids),
+                'monitoring': self.test_workflow_monitoring
+            }))
+            
+            # Print results as one block
             passed = sum(1 for result in test_results.values() if result)
             total = len(test_results)
             
-            for test_name, result in test_results.items():
-                status = "PASS" if result else "FAIL"
-                logger.info(f"{test_name.replace('_', ' ').title()}: {status}")
-            
-            logger.info(f"\nPassed: {passed}/{total}")
-            logger.info(f"Success Rate: {(passed/total)*100:.1f}%")
+            lines = ["", SEPARATOR, "WORKFLOW TEST RESULTS", SEPARATOR]
+            lines += [f"{test_name.replace('_', ' ').title()}: {'PASS' if result else 'FAIL'}"
+                      for test_name, result in test_results.items()]
+            lines += ["", f"Passed: {passed}/{total}", f"Success Rate: {(passed/total)*100:.1f}%"]
+            logger.info("\n".join(lines))
             
             # Return success based on whether majority of tests passed
             return passed >= total * 0.5  # At least 50% pass rate required
@@ -216,3 +216,92 @@ class EmbeddingTest(KolosalTestBase):
                 "model": model_name
             })
             return False
+
+    def batched_embedding(self,
+                          model_name="text-embedding-ada-002",
+                          inputs: Optional[List[str]] = None,
+                          batch_size: int = 16) -> bool:
+        """Test embedding several inputs per request, batch_size texts at a time.
+
+        Each batch is sent as one ``input: [...]`` request so the server can
+        embed it in a single pass; use concurrent_embedding for stress tests.
+        """
+        # Log test start
+        self.log_test_start("Batched Embedding Test", f"Model: {model_name}")
+
+        if inputs is None:
+            inputs = [
+                "Hello, world!",
+                "The quick brown fox jumps over the lazy dog.",
+                "Machine learning is transforming technology.",
+                "Natural language processing enables computers to understand text.",
+                "Embeddings convert text into numerical vectors."
+            ]
+        batch_size = max(1, batch_size)
+
+        print(
+            f"🚀 Testing {len(inputs)} embeddings in batches of {batch_size} with model: {model_name}")
+        print("⏳ Sending batched requests...")
+
+        try:
+            start_time = time.time()
+            embedding_dims = []
+            total_tokens = 0
+            batches = 0
+
+            for offset in range(0, len(inputs), batch_size):
+                batch = inputs[offset:offset + batch_size]
+                batch_start = time.time()
+                response = self.client.embeddings.create(
+                    model=model_name,
+                    input=batch
+                )
+                batch_time = time.time() - batch_start
+                batches += 1
+                tokens = response.usage.total_tokens if response.usage else 0
+                total_tokens += tokens
+                # Order by index in case the server returns items out of order
+                for item in sorted(response.data, key=lambda d: d.index):
+                    embedding_dims.append(len(item.embedding))
+                print(
+                    f"Batch {batches}: ⏱️ {batch_time:.2f}s, 📦 {len(batch)} inputs, "
+                    f"📥 {len(response.data)} embeddings, 📊 {tokens} tokens")
+
+            total_time = time.time() - start_time
+            successful = sum(1 for dims in embedding_dims if dims > 0)
+
+            print(f"📊 Total batched execution time: {total_time:.2f} seconds")
+            print(f"📊 Total tokens processed: {total_tokens}")
+            print(f"📊 Embeddings received: {successful}/{len(inputs)}")
+            print("")
+
+            success = successful == len(inputs)
+
+            # Log test completion
+            self.log_test_end("Batched Embedding Test", {
+                "success": success,
+                "total_inputs": len(inputs),
+                "successful_embeddings": successful,
+                "batch_size": batch_size,
+                "batches": batches,
+                "total_time": total_time,
+                "total_tokens": total_tokens,
+                "model": model_name
+            })
+
+            if success:
+                print(f"✅ Batched embedding test: PASS - {successful} embeddings in {batches} request(s)")
+            else:
+                print(f"❌ Batched embedding test: FAIL - Expected {len(inputs)} embeddings, got {successful}")
+            print("")
+            return success
+
+        except Exception as e:
+            print(f"❌ Batched embedding failed: {str(e)}")
+            print("")
+            self.log_test_end("Batched Embedding Test", {
+                "success": False,
+                "error": str(e),
+                "model": model_name
+            })
+            return False
@@ -4,12 +4,31 @@ import time
 import asyncio
 import json
 import os
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 import requests
 import aiohttp
 from tests.kolosal_tests import KolosalTestBase
 
 
+def _prepare_docx(docx_path: str) -> Tuple[str, float, float]:
+    """Read a DOCX and base64-encode it.
+
+    Returns (b64_data, file_size_kb, prep_seconds). The file is read once from
+    start to end, so the kernel is told to expect sequential access.
+    """
+    start_time = time.time()
+    with open(docx_path, "rb") as docx_file:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(docx_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        docx_bytes = docx_file.read()
+    b64_docx = base64.b64encode(docx_bytes).decode()
+    return b64_docx, len(docx_bytes) / 1024, time.time() - start_time
+
+
 class ParseDOCXTest(KolosalTestBase):
     """Test class for DOCX parsing functionality in Kolosal Server."""
 
@@ -125,8 +144,14 @@ class ParseDOCXTest(KolosalTestBase):
 
     def concurrent_parse_docx(self,
                               docx_paths: Optional[List[str]] = None,
-                              method: Optional[str] = "fast") -> bool:
-        """Test concurrent DOCX parsing requests using asyncio with comprehensive logging."""
+                              method: Optional[str] = "fast",
+                              num_workers: Optional[int] = None) -> bool:
+        """Test concurrent DOCX parsing requests using asyncio with comprehensive logging.
+
+        Files are read and encoded on ``num_workers`` threads (default
+        ``min(os.cpu_count(), 4)``) so the event loop is never blocked, and all
+        requests share one HTTP session.
+        """
         import os
         
         # Log test start
@@ -197,23 +222,26 @@ class ParseDOCXTest(KolosalTestBase):
             f"🚀 Testing {len(docx_paths)} concurrent DOCX parsing requests")
         print("⏳ Sending concurrent requests...")
         
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, 4)
+        num_workers = max(1, min(num_workers, len(docx_paths)))
+
         # Log request details
         request_config = {
             "concurrent_requests": len(docx_paths),
             "method": method,
+            "num_workers": num_workers,
             "file_paths": [os.path.basename(path) for path in docx_paths]
         }
         print(f"📤 Request configuration: {json.dumps(request_config, indent=2)}")
 
-        async def single_request(docx_path, request_id):
+        async def single_request(session, executor, docx_path, request_id):
             start_time = time.time()
 
             try:
-                # Read and encode DOCX
-                with open(docx_path, "rb") as docx_file:
-                    docx_bytes = docx_file.read()
-                    b64_docx = base64.b64encode(docx_bytes).decode()
-                    file_size_kb = len(docx_bytes) / 1024
+                # Read and encode DOCX off the event loop
+                loop = asyncio.get_running_loop()
+                b64_docx, file_size_kb, prep_time = await loop.run_in_executor(executor, _prepare_docx, docx_path)
             except Exception as e:
                 print(f"❌ Error reading file {docx_path}: {str(e)}")
                 raise
@@ -224,27 +252,30 @@ class ParseDOCXTest(KolosalTestBase):
                 "method": method
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(api_url, json=payload) as response:
-                    elapsed_time = time.time() - start_time
+            async with session.post(api_url, json=payload) as response:
+                elapsed_time = time.time() - start_time
 
-                    if response.status != 200:
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message=f"Failed to parse DOCX: {docx_path}"
-                        )
+                if response.status != 200:
+                    raise aiohttp.ClientResponseError(
+                        request_info=response.request_info,
+                        history=response.history,
+                        status=response.status,
+                        message=f"Failed to parse DOCX: {docx_path}"
+                    )
 
-                    _result = await response.json()
+                _result = await response.json()
 
-                    kb_per_second = file_size_kb / elapsed_time if elapsed_time > 0 else 0
+                kb_per_second = file_size_kb / elapsed_time if elapsed_time > 0 else 0
 
-                    return request_id, elapsed_time, file_size_kb, kb_per_second, docx_path
+                return request_id, elapsed_time, file_size_kb, kb_per_second, docx_path, prep_time
 
         async def run_concurrent_requests():
             start_time = time.time()
-            results = await asyncio.gather(*[single_request(path, i+1) for i, path in enumerate(docx_paths)])
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                async with aiohttp.ClientSession() as session:
+                    results = await asyncio.gather(*[
+                        single_request(session, executor, path, i+1) for i, path in enumerate(docx_paths)
+                    ])
             total_time = time.time() - start_time
             return results, total_time
 
@@ -263,7 +294,8 @@ class ParseDOCXTest(KolosalTestBase):
                         "elapsed_time": result[1],
                         "file_size_kb": result[2],
                         "kb_per_second": result[3],
-                        "file_name": os.path.basename(result[4])
+                        "file_name": os.path.basename(result[4]),
+                        "prep_time": result[5]
                     } for result in results
                 ]
             }
@@ -273,9 +305,9 @@ class ParseDOCXTest(KolosalTestBase):
             total_kb_processed = 0
             successful_requests = 0
             
-            for request_id, elapsed_time, file_size_kb, kb_per_second, docx_path in results:
+            for request_id, elapsed_time, file_size_kb, kb_per_second, docx_path, prep_time in results:
                 print(
-                    f"Request {request_id}: ⏱️ {elapsed_time:.2f}s, 📄 {file_size_kb:.2f} KB, 🔥 {kb_per_second:.2f} KB/sec")
+                    f"Request {request_id}: ⏱️ {elapsed_time:.2f}s (prep {prep_time:.2f}s), 📄 {file_size_kb:.2f} KB, 🔥 {kb_per_second:.2f} KB/sec")
                 print(f"DOCX: {docx_path}")
                 print("")
                 total_kb_processed += file_size_kb
@@ -305,6 +337,8 @@ class ParseDOCXTest(KolosalTestBase):
                 "successful_requests": successful_requests,
                 "total_time": total_time,
                 "total_kb_processed": total_kb_processed,
+                "total_prep_time": sum(result[5] for result in results),
+                "num_workers": num_workers,
                 "method": method
             })
             
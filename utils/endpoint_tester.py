@@ -6,8 +6,19 @@ based on the actual Kolosal Server configuration.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from config import SERVER_CONFIG, ENDPOINTS, get_full_url
+from suite_utils import SEPARATOR
+
+# One keep-alive session for every probe, so a validation run or endpoint
+# report talks to the server over pooled connections instead of a fresh
+# TCP connection per request
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 def test_endpoint_availability() -> Dict[str, bool]:
     """Test availability of all known endpoints."""
@@ -16,7 +27,7 @@ def test_endpoint_availability() -> Dict[str, bool]:
     for endpoint_name, endpoint_path in ENDPOINTS.items():
         try:
             url = get_full_url(endpoint_name)
-            response = requests.get(url, timeout=5)
+            response = _SESSION.get(url, timeout=5)
             # Consider 200, 404, 405 as "server responding" 
             # 404/405 means endpoint exists but may not support GET
             results[endpoint_name] = response.status_code in [200, 404, 405]
@@ -45,7 +56,7 @@ def test_specific_endpoints(endpoint_names: List[str]) -> Dict[str, Tuple[bool,
             
         try:
             url = get_full_url(endpoint_name)
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             success = response.status_code == 200
             results[endpoint_name] = (success, response.status_code, response.text[:200])
         except Exception as e:
@@ -57,7 +68,7 @@ def get_server_models() -> Optional[List[Dict]]:
     """Get available models from the server."""
     try:
         url = get_full_url("models")
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             return data.get("data", [])
@@ -69,7 +80,7 @@ def get_server_health() -> Optional[Dict]:
     """Get server health information."""
     try:
         url = get_full_url("health")
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         if response.status_code == 200:
             return response.json()
     except Exception:
@@ -80,15 +91,35 @@ def get_agent_system_health() -> Optional[Dict]:
     """Get agent system health information."""
     try:
         url = get_full_url("agents_health")
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         if response.status_code == 200:
             return response.json()
     except Exception:
         pass
     return None
 
+def _probe(url: str, timeout: float):
+    """GET url on the shared session, returning the response or the exception raised."""
+    try:
+        return _SESSION.get(url, timeout=timeout)
+    except Exception as e:
+        return e
+
+def _ok_json(response) -> Optional[Dict]:
+    """Decode a probe response body if it is a 200, else None."""
+    if isinstance(response, Exception) or response.status_code != 200:
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
 def validate_server_configuration() -> Dict[str, any]:
-    """Validate that the server matches expected configuration."""
+    """Validate that the server matches expected configuration.
+
+    The connectivity, health, models and agent probes are independent, so they
+    are sent concurrently; a URL shared by several probes is requested once.
+    """
     validation_results = {
         "server_responding": False,
         "health_endpoint": False,
@@ -99,41 +130,62 @@ def validate_server_configuration() -> Dict[str, any]:
         "errors": []
     }
     
+    probes = {
+        "server": (SERVER_CONFIG["base_url"], 5),
+        "health": (get_full_url("health"), 10),
+        "models": (get_full_url("models"), 10),
+        "agents": (get_full_url("agents_health"), 10),
+    }
+    unique_urls = {}
+    for url, timeout in probes.values():
+        unique_urls[url] = max(unique_urls.get(url, 0), timeout)
+    
+    with ThreadPoolExecutor(max_workers=len(unique_urls)) as executor:
+        futures = {url: executor.submit(_probe, url, timeout) for url, timeout in unique_urls.items()}
+        responses = {url: future.result() for url, future in futures.items()}
+    
     # Test basic connectivity
-    try:
-        response = requests.get(SERVER_CONFIG["base_url"], timeout=5)
+    response = responses[probes["server"][0]]
+    if isinstance(response, Exception):
+        validation_results["errors"].append(f"Server connection failed: {response}")
+    else:
         validation_results["server_responding"] = response.status_code in [200, 404, 405]
-    except Exception as e:
-        validation_results["errors"].append(f"Server connection failed: {e}")
     
     # Test health endpoint
-    health_data = get_server_health()
+    health_data = _ok_json(responses[probes["health"][0]])
     if health_data:
         validation_results["health_endpoint"] = True
         validation_results["health_status"] = health_data.get("status")
     
     # Test models endpoint
-    models_data = get_server_models()
+    models_body = _ok_json(responses[probes["models"][0]])
+    models_data = models_body.get("data", []) if isinstance(models_body, dict) else None
     if models_data:
         validation_results["models_endpoint"] = True
         validation_results["available_models"] = [model.get("id") for model in models_data]
     
     # Test agent system
-    agent_health = get_agent_system_health()
+    agent_health = _ok_json(responses[probes["agents"][0]])
     if agent_health:
         validation_results["agent_system"] = True
         validation_results["agent_count"] = agent_health.get("agent_count", 0)
     
     return validation_results
 
-def print_endpoint_report():
-    """Print a comprehensive endpoint availability report."""
-    print("\n" + "="*60)
+def print_endpoint_report(validation: Optional[Dict[str, any]] = None):
+    """Print a comprehensive endpoint availability report.
+
+    Args:
+        validation: Result of validate_server_configuration() to reuse; the
+            server is validated here when it is not supplied.
+    """
+    print("\n" + SEPARATOR)
     print("KOLOSAL SERVER ENDPOINT REPORT")
-    print("="*60)
+    print(SEPARATOR)
     
     # Basic server validation
-    validation = validate_server_configuration()
+    if validation is None:
+        validation = validate_server_configuration()
     
     print(f"Server Status: {'✅ Online' if validation['server_responding'] else '❌ Offline'}")
     print(f"Health Endpoint: {'✅ Available' if validation['health_endpoint'] else '❌ Unavailable'}")
@@ -167,7 +219,7 @@ def print_endpoint_report():
         for error in validation['errors']:
             print(f"  ❌ {error}")
     
-    print("="*60)
+    print(SEPARATOR)
 
 if __name__ == "__main__":
     print_endpoint_report()